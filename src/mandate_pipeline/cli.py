@@ -129,6 +129,12 @@ def main():
         default=3,
         help="Stop after N consecutive 404s (default: 3)",
     )
+    discover_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of document existence checks to run in parallel (default: 1)",
+    )
     discover_parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -203,6 +209,12 @@ def main():
         default=5,
         help="Stop after N consecutive 404s (default: 5)",
     )
+    download_session_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of document existence checks to run in parallel (default: 1)",
+    )
     download_session_parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -308,6 +320,12 @@ def main():
         default=5,
         help="Stop after N consecutive 404s (default: 5)",
     )
+    build_session_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of document existence checks to run in parallel (default: 1)",
+    )
     build_session_parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -444,6 +462,12 @@ def main():
         default=5,
         help="Stop after N consecutive 404s (default: 5)",
     )
+    download_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of document existence checks to run in parallel (default: 1)",
+    )
     download_parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -484,6 +508,12 @@ def main():
         default=3,
         help="Stop after N consecutive 404s (default: 3)",
     )
+    build_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of document existence checks to run in parallel (default: 1)",
+    )
     build_parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -535,6 +565,7 @@ def cmd_discover(args):
     print(f"Config directory: {args.config}")
     print(f"Data directory: {args.data}")
     print(f"Max consecutive misses: {args.max_misses}")
+    print(f"Concurrency: {args.concurrency}")
     print(f"Verbose: {verbose}")
     
     # Show current state
@@ -587,6 +618,7 @@ def cmd_discover(args):
         on_error=on_error,
         on_pattern_start=on_pattern_start if verbose else None,
         on_pattern_end=on_pattern_end if verbose else None,
+        concurrency=args.concurrency,
     )
     
     total_duration = time.time() - start_time
@@ -702,6 +734,7 @@ def cmd_download_resolutions(args):
     print(f"Session number: {args.session}")
     print(f"Data directory: {args.data}")
     print(f"Max consecutive misses: {args.max_misses}")
+    print(f"Concurrency: {args.concurrency}")
     print(f"Verbose: {verbose}")
     
     # Count existing PDFs
@@ -733,6 +766,7 @@ def cmd_download_resolutions(args):
         on_check=on_check if verbose else None,
         on_download=on_download if verbose else None,
         on_error=on_error,
+        concurrency=args.concurrency,
     )
     
     total_duration = time.time() - start_time
@@ -774,6 +808,7 @@ def cmd_build(args):
         config=args.config,
         data=args.data,
         max_misses=args.max_misses,
+        concurrency=args.concurrency,
         verbose=verbose,
     )
     discover_results, new_docs_count, discover_duration = cmd_discover(discover_args)
@@ -828,6 +863,7 @@ def cmd_download_session(args):
     print(f"Session number: {args.session}")
     print(f"Data directory: {args.data}")
     print(f"Max consecutive misses: {args.max_misses}")
+    print(f"Concurrency: {args.concurrency}")
     print(f"Verbose: {verbose}")
 
     # Count existing PDFs
@@ -859,6 +895,7 @@ def cmd_download_session(args):
         on_check=on_check if verbose else None,
         on_download=on_download if verbose else None,
         on_error=on_error,
+        concurrency=args.concurrency,
     )
 
     total_duration = time.time() - start_time
@@ -1195,6 +1232,7 @@ def cmd_build_session(args):
         config=args.config,
         data=args.data,
         max_misses=args.max_misses,
+        concurrency=args.concurrency,
         verbose=verbose,
     )
     download_results, download_count, download_duration = cmd_download_session(download_args)
@@ -1,14 +1,46 @@
 """Pipeline for discovering and processing UN documents."""
 
+import copy
 import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from datetime import datetime, timezone
+from functools import lru_cache, partial
+from itertools import count as count_from, islice
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterable, Iterator, Optional, Union
 
 import requests
 import yaml
 
-from .downloader import download_document, file_exists_for_symbol
+from .downloader import _get_session, build_download_url, fetch_document, file_exists_for_symbol
+
+# Use libyaml's C loader when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _file_cache_key(path: Path) -> tuple[str, int, int]:
+    """Build a cache key that changes whenever the file is rewritten."""
+    stat = path.stat()
+    return str(path.resolve()), stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=32)
+def _parse_patterns_file(path: str, mtime_ns: int, size: int) -> list[dict]:
+    """Parse patterns.yaml; cached on (path, mtime, size)."""
+    with open(path) as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
+
+    return config.get("patterns", [])
+
+
+@lru_cache(maxsize=32)
+def _parse_state_file(path: str, mtime_ns: int, size: int) -> dict:
+    """Parse state.json; cached on (path, mtime, size)."""
+    with open(path) as f:
+        return json.load(f)
 
 
 def load_patterns(config_path: Path) -> list[dict]:
@@ -26,10 +58,8 @@ def load_patterns(config_path: Path) -> list[dict]:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path) as f:
-        config = yaml.safe_load(f)
-
-    return config.get("patterns", [])
+    # Callers may mutate the result, so hand out a copy of the cached parse
+    return copy.deepcopy(_parse_patterns_file(*_file_cache_key(config_path)))
 
 
 def generate_symbols(pattern: dict, count: int = None, start_override: int = None) -> Iterator[str]:
@@ -56,16 +86,15 @@ def generate_symbols(pattern: dict, count: int = None, start_override: int = Non
             continue
         scalar_vars[key] = value
 
-    generated = 0
-    number = start
+    # Bind the scalar variables once; only the number changes per symbol
+    format_symbol = partial(template.format, **scalar_vars)
 
-    while count is None or generated < count:
-        vars_dict = scalar_vars.copy()
-        vars_dict["number"] = number
+    numbers = count_from(start)
+    if count is not None:
+        numbers = islice(numbers, max(count, 0))
 
-        yield template.format(**vars_dict)
-        generated += 1
-        number += 1
+    for number in numbers:
+        yield format_symbol(number=number)
 
 
 def document_exists(symbol: str) -> bool:
@@ -78,10 +107,10 @@ def document_exists(symbol: str) -> bool:
     Returns:
         True if document exists, False otherwise
     """
-    url = f"https://documents.un.org/api/symbol/access?s={symbol}&l=en&t=pdf"
+    url = build_download_url(symbol)
 
     try:
-        response = requests.head(url, allow_redirects=True, timeout=10)
+        response = _get_session().head(url, allow_redirects=True, timeout=10)
         # 200 = found, 302 redirect to PDF = found
         # 404 or error page = not found
         if response.status_code == 200:
@@ -92,9 +121,124 @@ def document_exists(symbol: str) -> bool:
         return False
 
 
+def probe_documents(
+    symbols: Iterable[str],
+    concurrency: int = 1,
+    skip: Optional[Callable[[str], bool]] = None,
+    check: Optional[Callable[[str], object]] = None,
+    discard: Optional[Callable[[str, object], None]] = None,
+) -> Iterator[tuple[str, object]]:
+    """
+    Check which documents exist, keeping up to `concurrency` checks in flight.
+
+    Results are yielded in input order, so callers can keep their
+    "stop after N consecutive misses" logic unchanged. The number of checks
+    in flight adapts to the hit density: it doubles after each hit (up to
+    `concurrency`) and halves after each miss, so few speculative checks are
+    issued past the end of a series. When the caller stops early, at most
+    `concurrency - 1` speculative checks are wasted; checks that already
+    started are waited for and their truthy results passed to `discard`,
+    so side effects past the stop point (e.g. downloads) can be undone.
+
+    Args:
+        symbols: Document symbols to check (may be an infinite generator)
+        concurrency: Maximum number of simultaneous checks (1 = sequential)
+        skip: Optional predicate; matching symbols are not checked remotely
+        check: Remote check to run per symbol (default: document_exists);
+            its result must be truthy for documents that exist
+        discard: Optional callback(symbol, result) for truthy results of
+            speculative checks that were never yielded
+
+    Yields:
+        Tuples of (symbol, result of check), where the result is None for
+        skipped symbols
+    """
+    if check is None:
+        check = document_exists
+
+    if concurrency <= 1:
+        for symbol in symbols:
+            if skip is not None and skip(symbol):
+                yield symbol, None
+            else:
+                yield symbol, check(symbol)
+        return
+
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    pending = deque()  # (symbol, future or None), in input order
+    in_flight = 0
+    window = concurrency  # a fresh series is usually hit-dense
+    iterator = iter(symbols)
+    exhausted = False
+
+    try:
+        while True:
+            # Top up the window before handing out the next result
+            while not exhausted and in_flight < window:
+                symbol = next(iterator, None)
+                if symbol is None:
+                    exhausted = True
+                elif skip is not None and skip(symbol):
+                    pending.append((symbol, None))
+                else:
+                    pending.append((symbol, executor.submit(check, symbol)))
+                    in_flight += 1
+
+            if not pending:
+                return
+
+            symbol, future = pending.popleft()
+            if future is None:
+                yield symbol, None
+            else:
+                in_flight -= 1
+                result = future.result()
+                window = min(concurrency, window * 2) if result else max(1, window // 2)
+                yield symbol, result
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+        if discard is not None:
+            for symbol, future in pending:
+                if future is not None and not future.cancelled() and future.exception() is None:
+                    result = future.result()
+                    if result:
+                        discard(symbol, result)
+
+
+def _fetch_timed(symbol: str, output_dir: Path) -> Union[bool, tuple[Optional[Path], Optional[Exception], float]]:
+    """
+    Check for a document and download it in the same request.
+
+    Args:
+        symbol: Document symbol (e.g., "A/80/L.1")
+        output_dir: Directory to store PDFs
+
+    Returns:
+        False if the document does not exist, otherwise a tuple of
+        (pdf_path, error, duration); if the download failed, pdf_path is
+        None and error holds the exception.
+    """
+    download_start = time.time()
+    try:
+        pdf_path = fetch_document(symbol, output_dir)
+    except Exception as e:
+        return None, e, 0.0
+    if pdf_path is None:
+        return False
+    return pdf_path, None, time.time() - download_start
+
+
+def _discard_fetched(symbol: str, result: tuple[Optional[Path], Optional[Exception], float]) -> None:
+    """Delete a document downloaded by a speculative check past the stop point."""
+    pdf_path, _, _ = result
+    if pdf_path is not None:
+        pdf_path.unlink(missing_ok=True)
+
+
 def discover_documents(
     pattern: dict,
     max_consecutive_misses: int = 3,
+    concurrency: int = 1,
 ) -> Iterator[str]:
     """
     Discover available documents matching a pattern.
@@ -105,14 +249,15 @@ def discover_documents(
     Args:
         pattern: Pattern definition
         max_consecutive_misses: Stop after this many consecutive misses
+        concurrency: Number of existence checks to run in parallel
 
     Yields:
         Symbols of documents that exist
     """
     consecutive_misses = 0
 
-    for symbol in generate_symbols(pattern):
-        if document_exists(symbol):
+    for symbol, exists in probe_documents(generate_symbols(pattern), concurrency):
+        if exists:
             consecutive_misses = 0
             yield symbol
         else:
@@ -136,8 +281,8 @@ def load_sync_state(state_path: Path) -> dict:
     if not state_path.exists():
         return {"patterns": {}}
 
-    with open(state_path) as f:
-        return json.load(f)
+    # Sync runs mutate the state in place, so hand out a copy of the cached parse
+    return copy.deepcopy(_parse_state_file(*_file_cache_key(state_path)))
 
 
 def save_sync_state(state_path: Path, state: dict) -> None:
@@ -154,6 +299,8 @@ def save_sync_state(state_path: Path, state: dict) -> None:
     with open(state_path, "w") as f:
         json.dump(state, f, indent=2)
 
+    _parse_state_file.cache_clear()
+
 
 def get_start_number(pattern: dict, state: dict) -> int:
     """
@@ -182,6 +329,7 @@ def sync_simple_pattern(
     data_dir: Path,
     output_dir: Path,
     max_consecutive_misses: int = 3,
+    concurrency: int = 1,
 ) -> tuple[list[str], int]:
     """
     Sync documents for a simple pattern (no list variables).
@@ -195,6 +343,7 @@ def sync_simple_pattern(
         data_dir: Base data directory
         output_dir: Directory to store PDFs
         max_consecutive_misses: Stop after this many consecutive 404s
+        concurrency: Number of existence checks to run in parallel
 
     Returns:
         Tuple of (list of newly downloaded symbols, new highest_found number)
@@ -209,26 +358,38 @@ def sync_simple_pattern(
     consecutive_misses = 0
     current_number = start_number
 
-    for symbol in generate_symbols(pattern, start_override=start_number):
-        # Skip if we already have this file locally
-        if file_exists_for_symbol(symbol, output_dir):
-            consecutive_misses = 0
-            highest_found = current_number
-            current_number += 1
-            continue
+    def have_locally(symbol: str) -> bool:
+        return file_exists_for_symbol(symbol, output_dir)
 
-        # Check if document exists remotely
-        if document_exists(symbol):
-            consecutive_misses = 0
-            download_document(symbol, output_dir=output_dir, skip_existing=False)
-            new_docs.append(symbol)
-            highest_found = current_number
-        else:
-            consecutive_misses += 1
-            if consecutive_misses >= max_consecutive_misses:
-                break
+    # Each remote check downloads the document when it exists
+    fetch = partial(_fetch_timed, output_dir=output_dir)
+    symbols = generate_symbols(pattern, start_override=start_number)
+    with closing(probe_documents(
+        symbols, concurrency, skip=have_locally, check=fetch, discard=_discard_fetched
+    )) as probes:
+        for symbol, result in probes:
+            # Skip if we already have this file locally
+            if result is None:
+                consecutive_misses = 0
+                highest_found = current_number
+                current_number += 1
+                continue
 
-        current_number += 1
+            # Check if document exists remotely
+            if result:
+                _, error, _ = result
+                if error is not None:
+                    raise error
+
+                consecutive_misses = 0
+                new_docs.append(symbol)
+                highest_found = current_number
+            else:
+                consecutive_misses += 1
+                if consecutive_misses >= max_consecutive_misses:
+                    break
+
+            current_number += 1
 
     return new_docs, highest_found
 
@@ -238,6 +399,7 @@ def sync_pattern(
     state: dict,
     data_dir: Path,
     max_consecutive_misses: int = 3,
+    concurrency: int = 1,
 ) -> tuple[list[str], int]:
     """
     Sync documents for a single pattern - discover and download new ones.
@@ -247,6 +409,7 @@ def sync_pattern(
         state: Current sync state
         data_dir: Directory to store PDFs (data_dir/pdfs/)
         max_consecutive_misses: Stop after this many consecutive 404s
+        concurrency: Number of existence checks to run in parallel
 
     Returns:
         Tuple of (list of newly downloaded symbols, new highest_found number)
@@ -258,7 +421,7 @@ def sync_pattern(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     new_docs, highest = sync_simple_pattern(
-        pattern, state, data_dir, output_dir, max_consecutive_misses
+        pattern, state, data_dir, output_dir, max_consecutive_misses, concurrency
     )
     
     # Update state for this pattern
@@ -273,6 +436,7 @@ def sync_all_patterns(
     config_dir: Path,
     data_dir: Path,
     max_consecutive_misses: int = 3,
+    concurrency: int = 1,
 ) -> dict:
     """
     Sync all patterns defined in patterns.yaml.
@@ -281,6 +445,7 @@ def sync_all_patterns(
         config_dir: Directory containing patterns.yaml
         data_dir: Directory to store PDFs and state
         max_consecutive_misses: Stop after this many consecutive 404s per pattern
+        concurrency: Number of existence checks to run in parallel
 
     Returns:
         Dict with sync results: {pattern_name: [new_symbols], ...}
@@ -293,7 +458,7 @@ def sync_all_patterns(
 
     for pattern in patterns:
         new_docs, _ = sync_pattern(
-            pattern, state, data_dir, max_consecutive_misses
+            pattern, state, data_dir, max_consecutive_misses, concurrency
         )
         results[pattern["name"]] = new_docs
 
@@ -311,6 +476,7 @@ def sync_session_resolutions(
     on_check: callable = None,
     on_download: callable = None,
     on_error: callable = None,
+    concurrency: int = 1,
 ) -> dict:
     """
     Download all resolutions from a specific UN General Assembly session.
@@ -322,11 +488,11 @@ def sync_session_resolutions(
         on_check: Callback(symbol, exists, consecutive_misses) for each check
         on_download: Callback(symbol, path, size, duration) for each download
         on_error: Callback(symbol, error) for download errors
+        concurrency: Number of existence checks to run in parallel
 
     Returns:
         Dict with results: {"session_resolutions": [new_symbols]}
     """
-    import time
 
     # Create output directory (flat structure)
     output_dir = data_dir / "pdfs"
@@ -348,50 +514,52 @@ def sync_session_resolutions(
     print(f"Starting to download resolutions for session {session}")
     print(f"Pattern: A/RES/{session}/1, A/RES/{session}/2, A/RES/{session}/3...")
 
-    for symbol in generate_symbols(pattern):
-        # Skip if we already have this file locally
-        if file_exists_for_symbol(symbol, output_dir):
-            consecutive_misses = 0
-            if on_check:
-                on_check(symbol, True, 0)  # Report as exists (locally)
-            current_number += 1
-            continue
-
-        # Check if document exists remotely
-        exists = document_exists(symbol)
+    def have_locally(symbol: str) -> bool:
+        return file_exists_for_symbol(symbol, output_dir)
 
-        if exists:
-            consecutive_misses = 0
+    # Each remote check downloads the document when it exists
+    fetch = partial(_fetch_timed, output_dir=output_dir)
+    symbols = generate_symbols(pattern)
+    with closing(probe_documents(
+        symbols, concurrency, skip=have_locally, check=fetch, discard=_discard_fetched
+    )) as probes:
+        for symbol, result in probes:
+            # Skip if we already have this file locally
+            if result is None:
+                consecutive_misses = 0
+                if on_check:
+                    on_check(symbol, True, 0)  # Report as exists (locally)
+                current_number += 1
+                continue
 
-            if on_check:
-                on_check(symbol, True, 0)
+            # Check if document exists remotely
+            if result:
+                pdf_path, error, download_duration = result
+                consecutive_misses = 0
 
-            # Download the document
-            try:
-                download_start = time.time()
-                pdf_path = download_document(symbol, output_dir=output_dir, skip_existing=False)
-                download_duration = time.time() - download_start
-                file_size = pdf_path.stat().st_size
+                if on_check:
+                    on_check(symbol, True, 0)
 
-                if on_download:
-                    on_download(symbol, pdf_path, file_size, download_duration)
+                if error is None:
+                    file_size = pdf_path.stat().st_size
 
-                new_docs.append(symbol)
+                    if on_download:
+                        on_download(symbol, pdf_path, file_size, download_duration)
 
-            except Exception as e:
-                if on_error:
-                    on_error(symbol, str(e))
-        else:
-            consecutive_misses += 1
+                    new_docs.append(symbol)
+                elif on_error:
+                    on_error(symbol, str(error))
+            else:
+                consecutive_misses += 1
 
-            if on_check:
-                on_check(symbol, False, consecutive_misses)
+                if on_check:
+                    on_check(symbol, False, consecutive_misses)
 
-            if consecutive_misses >= max_consecutive_misses:
-                print(f"Stopping after {max_consecutive_misses} consecutive 404s at {symbol}")
-                break
+                if consecutive_misses >= max_consecutive_misses:
+                    print(f"Stopping after {max_consecutive_misses} consecutive 404s at {symbol}")
+                    break
 
-        current_number += 1
+            current_number += 1
 
     pattern_duration = time.time() - pattern_start_time
     if pattern_duration < 1:
@@ -417,6 +585,7 @@ def sync_all_patterns_verbose(
     on_error: callable = None,
     on_pattern_start: callable = None,
     on_pattern_end: callable = None,
+    concurrency: int = 1,
 ) -> dict:
     """
     Sync all patterns with verbose callbacks for logging.
@@ -430,11 +599,11 @@ def sync_all_patterns_verbose(
         on_error: Callback(symbol, error) for download errors
         on_pattern_start: Callback(pattern_name, start_number) when starting a pattern
         on_pattern_end: Callback(pattern_name, new_count, duration) when done with pattern
+        concurrency: Number of existence checks to run in parallel
 
     Returns:
         Dict with sync results: {pattern_name: [new_symbols], ...}
     """
-    import time
 
     patterns = load_patterns(config_dir / "patterns.yaml")
     state_path = data_dir / "state.json"
@@ -463,52 +632,54 @@ def sync_all_patterns_verbose(
         consecutive_misses = 0
         current_number = start_number
 
-        for symbol in generate_symbols(pattern, start_override=start_number):
-            # Skip if we already have this file locally
-            if file_exists_for_symbol(symbol, output_dir):
-                consecutive_misses = 0
-                highest_found = current_number
-                skipped_docs += 1
-                if on_check:
-                    on_check(symbol, True, 0)  # Report as exists (locally)
-                current_number += 1
-                continue
+        def have_locally(symbol: str) -> bool:
+            return file_exists_for_symbol(symbol, output_dir)
+
+        # Each remote check downloads the document when it exists
+        fetch = partial(_fetch_timed, output_dir=output_dir)
+        symbols = generate_symbols(pattern, start_override=start_number)
+        with closing(probe_documents(
+            symbols, concurrency, skip=have_locally, check=fetch, discard=_discard_fetched
+        )) as probes:
+            for symbol, result in probes:
+                # Skip if we already have this file locally
+                if result is None:
+                    consecutive_misses = 0
+                    highest_found = current_number
+                    skipped_docs += 1
+                    if on_check:
+                        on_check(symbol, True, 0)  # Report as exists (locally)
+                    current_number += 1
+                    continue
 
-            # Check if document exists remotely
-            exists = document_exists(symbol)
+                # Check if document exists remotely
+                if result:
+                    pdf_path, error, download_duration = result
+                    consecutive_misses = 0
 
-            if exists:
-                consecutive_misses = 0
+                    if on_check:
+                        on_check(symbol, True, 0)
 
-                if on_check:
-                    on_check(symbol, True, 0)
+                    if error is None:
+                        file_size = pdf_path.stat().st_size
 
-                # Download the document
-                try:
-                    download_start = time.time()
-                    pdf_path = download_document(symbol, output_dir=output_dir, skip_existing=False)
-                    download_duration = time.time() - download_start
-                    file_size = pdf_path.stat().st_size
+                        if on_download:
+                            on_download(symbol, pdf_path, file_size, download_duration)
 
-                    if on_download:
-                        on_download(symbol, pdf_path, file_size, download_duration)
+                        new_docs.append(symbol)
+                        highest_found = current_number
+                    elif on_error:
+                        on_error(symbol, str(error))
+                else:
+                    consecutive_misses += 1
 
-                    new_docs.append(symbol)
-                    highest_found = current_number
+                    if on_check:
+                        on_check(symbol, False, consecutive_misses)
 
-                except Exception as e:
-                    if on_error:
-                        on_error(symbol, str(e))
-            else:
-                consecutive_misses += 1
+                    if consecutive_misses >= max_consecutive_misses:
+                        break
 
-                if on_check:
-                    on_check(symbol, False, consecutive_misses)
-
-                if consecutive_misses >= max_consecutive_misses:
-                    break
-
-            current_number += 1
+                current_number += 1
 
         # Update state for this pattern
         if pattern_name not in state["patterns"]:
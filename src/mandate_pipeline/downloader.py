@@ -1,8 +1,33 @@
 """Download documents from the UN Official Document System."""
 
 from pathlib import Path
+from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DOWNLOAD_CHUNK_SIZE = 1 << 16  # bytes
+
+_SESSION = None
+
+
+def _get_session() -> requests.Session:
+    """Get or create a reusable keep-alive session for UN ODS requests."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = requests.Session()
+        retries = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["HEAD", "GET"],
+            raise_on_status=False,
+        )
+        # Pool sized for concurrent existence checks during discovery
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=20, max_retries=retries)
+        _SESSION.mount("https://", adapter)
+    return _SESSION
 
 
 def symbol_to_filename(symbol: str) -> str:
@@ -47,16 +72,66 @@ def download_document(symbol: str, output_dir: Path, language: str = "en", skip_
     # Build the download URL (API endpoint that redirects to PDF)
     url = build_download_url(symbol, language)
 
-    # Download the file, following redirects
-    response = requests.get(url, allow_redirects=True)
-    response.raise_for_status()
+    # Stream the file to disk, following redirects
+    with _get_session().get(url, allow_redirects=True, stream=True) as response:
+        response.raise_for_status()
+        _save_response(response, output_path)
+
+    return output_path
+
+
+def fetch_document(symbol: str, output_dir: Path, language: str = "en") -> Optional[Path]:
+    """
+    Download a UN document if it exists, using a single request.
 
-    # Save the file
-    output_path.write_bytes(response.content)
+    The existence check and the download share one GET, so a discovered
+    document costs one round-trip instead of a HEAD followed by a GET.
+
+    Args:
+        symbol: UN document symbol (e.g., "A/80/L.1")
+        output_dir: Directory to save the downloaded file
+        language: Language code (default: "en")
+
+    Returns:
+        Path to the downloaded file, or None if the document does not exist
+    """
+    output_path = Path(output_dir) / symbol_to_filename(symbol)
+    url = build_download_url(symbol, language)
+
+    try:
+        response = _get_session().get(url, allow_redirects=True, stream=True, timeout=10)
+    except requests.RequestException:
+        return None
+
+    with response:
+        # 200 with a PDF = found; 404 or error page = not found
+        content_type = response.headers.get("Content-Type", "")
+        if response.status_code != 200 or "pdf" not in content_type.lower():
+            # Read the (small) error page so the connection can be reused
+            response.content
+            return None
+
+        _save_response(response, output_path)
 
     return output_path
 
 
+def _save_response(response: requests.Response, output_path: Path) -> None:
+    """Stream a response body to disk via a temporary file."""
+    # Write to a temporary name first so an interrupted download never
+    # looks like a cached file.
+    partial_path = output_path.with_name(output_path.name + ".part")
+    try:
+        with open(partial_path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                f.write(chunk)
+    except BaseException:
+        partial_path.unlink(missing_ok=True)
+        raise
+
+    partial_path.replace(output_path)
+
+
 def build_download_url(symbol: str, language: str = "en") -> str:
     """
     Build the download URL for a UN document.
@@ -6,6 +6,145 @@ from pathlib import Path
 import pymupdf
 
 
+def _compile_alternation(patterns: tuple[str, ...], flags: int = 0) -> re.Pattern:
+    """Fuse a group of patterns into one alternation so a line is matched in a single call."""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), flags)
+
+# Operative paragraphs: number at start of line, followed by period and whitespace
+# Anchored on a literal newline, which lets the engine skip ahead with a fast
+# character search; the text is searched with a newline prepended.
+_OP_START_RE = re.compile(r"\n[^\S\n]*(\d+)\.(?=\s|$)")
+_NON_SPACE_RE = re.compile(r"\S")
+
+# Lettered paragraphs: (a), (b), (c), etc. at start of line.
+_LETTERED_PARA_RE = re.compile(r"^\s*\(([a-z])\)\s+(.+?)(?=^\s*\([a-z]\)\s+|\Z)", re.MULTILINE | re.DOTALL)
+
+# First numbered line marks the end of the header region
+_STOP_RE = re.compile(r"^\s*\d+\.")
+
+# Resolution title format, e.g. "80/60. Title..."
+_RES_TITLE_RE = re.compile(r"^\d+/\d+\.\s+\S")
+_RESOLUTION_ADOPTED_RE = re.compile(r"Resolution adopted by", re.IGNORECASE)
+_DRAFT_HEADING_RE = re.compile(r"draft (resolution|decision)", re.IGNORECASE)
+_OUTCOME_DOCUMENT_RE = re.compile(r"Adopts the following outcome document", re.IGNORECASE)
+_OUTCOME_PREAMBLE_RE = re.compile(r"^(We,|Recalling|Reaffirming|Noting)")
+
+# Header lines to skip, checked from cheapest to most expensive: whole
+# lines, literal prefixes and phrases, then the remaining regexes.
+_SKIP_LINES = frozenset((
+    "United Nations",
+    "General Assembly",
+    "Security Council",
+    "First Committee",
+    "Second Committee",
+    "Third Committee",
+    "Fourth Committee",
+    "Fifth Committee",
+    "Sixth Committee",
+))
+_SKIP_PREFIXES = (
+    "Distr.",
+    "Agenda item",
+    "Resolution adopted by",
+    "A/RES",
+    "Original:",
+    "[on the report of",
+    "[without reference to",
+)
+_SKIP_PHRASES = (
+    "on the basis of informal consultations",
+)
+_SKIP_RE = _compile_alternation((
+    r"^[A-Z]{1,2}/[A-Z0-9./-]+$",
+    r"^Item\s+\d+",
+    r"^\d{1,2}\s+\w+\s+\d{4}$",
+    r"^\d{2}-\d{5}\s+\(E\).*$",
+    r"^\*?\d{6,}\*?$",
+    r"^\w+ session$",
+    # Skip facilitator/submitter lines (end with country in parentheses)
+    r"^.*\([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+of\s+[A-Z][a-z]+)?\s*\)\s*$",
+    # Skip lines referencing other draft resolutions
+    r"^.*resolution\s+A/C\.\d+/\d+/L\.\d+",
+))
+
+# Patterns that indicate end of title (start of document body)
+_TITLE_END_RE = _compile_alternation((
+    r"^The General Assembly",
+    r"^The Security Council",
+    r"^Recalling",
+    r"^Reaffirming",
+    r"^Noting",
+    r"^Recognizing",
+    r"^Welcoming",
+    r"^Expressing",
+    r"^Bearing in mind",
+    r"^Having",
+    r"^Mindful",
+    r"^Concerned",
+    r"^Convinced",
+    r"^Guided by",
+    r"^Taking note",
+    r"^Pursuant to",
+))
+
+# Amendments: patterns that indicate end of header / start of body
+_AMENDMENT_BODY_START_RE = _compile_alternation((
+    r"^The General Assembly",
+    r"^The Security Council",
+    r"^Recalling",
+    r"^Reaffirming",
+    r"^Noting",
+    r"^Recognizing",
+    r"^Welcoming",
+    r"^Expressing",
+    r"^Bearing in mind",
+    r"^Having",
+    r"^Mindful",
+    r"^Concerned",
+    r"^Convinced",
+    r"^Guided by",
+    r"^Taking note",
+    r"^Pursuant to",
+    r"^In operative paragraph",
+    r"^In paragraph",
+    r"^Insert",
+    r"^Replace",
+    r"^Delete",
+    r"^Add",
+    r"^After",
+    r"^Before",
+), re.IGNORECASE)
+
+# Amendments: patterns that indicate footer / end of body
+_AMENDMENT_FOOTER_RE = _compile_alternation((
+    r"^\d{2}-\d{5}",  # Document ID like 24-12345
+    r"^\*\d{6,}\*",  # Barcode pattern
+    r"^GE\.\d{2}-\d+",  # Geneva ID
+))
+
+# Amendments: header patterns to skip
+_AMENDMENT_HEADER_RE = _compile_alternation((
+    r"^United Nations$",
+    r"^General Assembly$",
+    r"^Security Council$",
+    r"^[A-Z]{1,2}/[A-Z0-9./-]+$",
+    r"^Agenda item",
+    r"^Item\s+\d+",
+    r"^\d{1,2}\s+\w+\s+\d{4}$",
+    r"^Distr\.",
+    r"^Original:",
+    r"^\w+ session$",
+    r"^(First|Second|Third|Fourth|Fifth|Sixth) Committee$",
+))
+
+_AGENDA_RE = re.compile(
+    r"\b(?:(?P<agenda>Agenda item[s]?)|Item)\s+(?P<number>\d+[A-Za-z]?)\b",
+    re.IGNORECASE,
+)
+
+_SYMBOL_RE = re.compile(r"\bA(?:/[A-Z0-9.]+)+/L\.\d+\b", re.IGNORECASE)
+
+
 def extract_text(pdf_path: Path) -> str:
     """
     Extract full text from a PDF file.
@@ -46,17 +185,38 @@ def extract_operative_paragraphs(text: str) -> dict[int, str]:
     """
     paragraphs = {}
 
-    # Pattern: number at start of line, followed by period and text
-    # The paragraph continues until the next numbered paragraph or end
-    pattern = r"^\s*(\d+)\.\s+(.+?)(?=^\s*\d+\.\s+|\Z)"
+    # The regex engine finds candidate paragraph starts (a number at the
+    # start of a line); each paragraph runs until the next accepted start.
+    text = "\n" + text
+    num = None
+    content_at = 0
+    # Content of a paragraph starts at the first non-blank text after its
+    # number, even if that text itself looks like the next number, so starts
+    # before the end of that line are ignored.
+    resume_at = 0
+
+    for match in _OP_START_RE.finditer(text):
+        # A bare number on the last line does not start a paragraph
+        if match.start() < resume_at or match.end() == len(text):
+            continue
 
-    matches = re.findall(pattern, text, re.MULTILINE | re.DOTALL)
+        if num is not None:
+            paragraphs[num] = " ".join(text[content_at:match.start()].split())
 
-    for num_str, content in matches:
-        num = int(num_str)
-        # Clean up the content: normalize whitespace
-        cleaned = " ".join(content.split())
-        paragraphs[num] = cleaned
+        num = int(match.group(1))
+        content_at = match.end()
+        first_word = _NON_SPACE_RE.search(text, content_at)
+        if first_word is None:
+            resume_at = len(text) + 1
+        elif "\n" in text[content_at:first_word.start()]:
+            line_end = text.find("\n", first_word.start())
+            resume_at = len(text) if line_end == -1 else line_end
+
+    # A bare number needs whitespace after it plus at least one more character
+    if num is not None:
+        content = text[content_at:].split()
+        if content or len(text) - content_at >= 2:
+            paragraphs[num] = " ".join(content)
 
     return paragraphs
 
@@ -76,13 +236,7 @@ def extract_lettered_paragraphs(text: str) -> dict[str, str]:
     """
     paragraphs = {}
 
-    # Pattern: (a), (b), (c), etc. at start of line
-    # The paragraph continues until the next lettered paragraph or end
-    pattern = r"^\s*\(([a-z])\)\s+(.+?)(?=^\s*\([a-z]\)\s+|\Z)"
-
-    matches = re.findall(pattern, text, re.MULTILINE | re.DOTALL)
-
-    for letter, content in matches:
+    for letter, content in _LETTERED_PARA_RE.findall(text):
         # Clean up the content: normalize whitespace
         cleaned = " ".join(content.split())
         paragraphs[letter] = cleaned
@@ -104,78 +258,26 @@ def extract_title(text: str) -> str:
         Extracted title string or empty string if not found
     """
     lines = text.splitlines()
-    stop_indices = []
-
-    for idx, line in enumerate(lines):
-        if re.match(r"^\s*\d+\.", line):
-            stop_indices.append(idx)
-            break
-
-    stop_at = min(stop_indices) if stop_indices else len(lines)
-
-    skip_prefixes = (
-        "Distr.",
-    )
-    skip_regexes = [
-        r"^United Nations$",
-        r"^General Assembly$",
-        r"^Security Council$",
-        r"^[A-Z]{1,2}/[A-Z0-9./-]+$",
-        r"^Agenda item",
-        r"^Item\s+\d+",
-        r"^\d{1,2}\s+\w+\s+\d{4}$",
-        r"^\d{2}-\d{5}\s+\(E\).*$",
-        r"^\*?\d{6,}\*?$",
-        r"^Resolution adopted by",
-        r"^\w+ session$",
-        r"^(First|Second|Third|Fourth|Fifth|Sixth) Committee$",
-        r"^A/RES",
-        r"^Original:",
-        r"^\[on the report of",
-        r"^\[without reference to",
-        # Skip facilitator/submitter lines (end with country in parentheses)
-        r"^.*\([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*(?:\s+of\s+[A-Z][a-z]+)?\s*\)\s*$",
-        # Skip "on the basis of informal consultations" lines
-        r".*on the basis of informal consultations",
-        # Skip lines referencing other draft resolutions
-        r"^.*resolution\s+A/C\.\d+/\d+/L\.\d+",
-    ]
-
-    # Patterns that indicate end of title (start of document body)
-    title_end_patterns = [
-        r"^The General Assembly",
-        r"^The Security Council",
-        r"^Recalling",
-        r"^Reaffirming",
-        r"^Noting",
-        r"^Recognizing",
-        r"^Welcoming",
-        r"^Expressing",
-        r"^Bearing in mind",
-        r"^Having",
-        r"^Mindful",
-        r"^Concerned",
-        r"^Convinced",
-        r"^Guided by",
-        r"^Taking note",
-        r"^Pursuant to",
-    ]
+    # Strip every line once; the passes below index into this list
+    stripped = list(map(str.strip, lines))
+    stop_at = next((idx for idx, line in enumerate(lines) if _STOP_RE.match(line)), len(lines))
 
     def is_skip_line(candidate: str) -> bool:
-        if candidate.startswith(skip_prefixes):
-            return True
-        if any(re.match(pattern, candidate) for pattern in skip_regexes):
-            return True
-        return False
+        return (
+            candidate in _SKIP_LINES
+            or candidate.startswith(_SKIP_PREFIXES)
+            or any(phrase in candidate for phrase in _SKIP_PHRASES)
+            or _SKIP_RE.match(candidate) is not None
+        )
 
     def is_title_end(candidate: str) -> bool:
-        return any(re.match(pattern, candidate) for pattern in title_end_patterns)
+        return _TITLE_END_RE.match(candidate) is not None
 
     # For resolutions: find title after "Resolution adopted by" line
     # The title format is "80/1. Title..." and may span multiple lines
     resolution_start = None
     for idx, line in enumerate(lines[:stop_at]):
-        if re.search(r"Resolution adopted by", line, re.IGNORECASE):
+        if _RESOLUTION_ADOPTED_RE.search(line):
             resolution_start = idx + 1
             break
 
@@ -183,10 +285,8 @@ def extract_title(text: str) -> str:
         # Look for resolution number format (e.g., "80/60. Title...")
         res_title_parts = []
         collecting_res_title = False
-        for line in lines[resolution_start:stop_at]:
-            candidate = line.strip()
-
-            if re.match(r"^\d+/\d+\.\s+\S", candidate):
+        for candidate in stripped[resolution_start:stop_at]:
+            if _RES_TITLE_RE.match(candidate):
                 res_title_parts.append(candidate)
                 collecting_res_title = True
                 continue
@@ -204,7 +304,7 @@ def extract_title(text: str) -> str:
     # For proposals: find title after "draft resolution" or "draft decision" line
     start_at = 0
     for idx, line in enumerate(lines[:stop_at]):
-        if re.search(r"draft (resolution|decision)", line, re.IGNORECASE):
+        if _DRAFT_HEADING_RE.search(line):
             start_at = idx + 1
             break
 
@@ -212,15 +312,13 @@ def extract_title(text: str) -> str:
     title_parts = []
     collecting = False
 
-    for line in lines[start_at:stop_at]:
-        candidate = line.strip()
-
+    for candidate in stripped[start_at:stop_at]:
         # Skip empty lines before title starts
         if not candidate and not collecting:
             continue
 
         # Check for resolution number format (e.g., "80/60. Title...")
-        if re.match(r"^\d+/\d+\.\s+\S", candidate):
+        if _RES_TITLE_RE.match(candidate):
             return candidate
 
         # Skip header lines
@@ -247,7 +345,7 @@ def extract_title(text: str) -> str:
     # Structure: "Adopts the following outcome document...:" then blank lines, then actual title
     outcome_start = None
     for idx, line in enumerate(lines):
-        if re.search(r"Adopts the following outcome document", line, re.IGNORECASE):
+        if _OUTCOME_DOCUMENT_RE.search(line):
             outcome_start = idx
             break
 
@@ -264,15 +362,13 @@ def extract_title(text: str) -> str:
         if colon_found:
             outcome_title_parts = []
             collecting_outcome = False
-            for line in lines[title_start:]:
-                candidate = line.strip()
-
+            for candidate in stripped[title_start:]:
                 # Skip empty lines before title
                 if not candidate and not collecting_outcome:
                     continue
 
                 # Stop at preambular markers (We, the Ministers... or Recalling...)
-                if re.match(r"^(We,|Recalling|Reaffirming|Noting)", candidate):
+                if _OUTCOME_PREAMBLE_RE.match(candidate):
                     break
 
                 # Empty line after collecting means done
@@ -305,64 +401,14 @@ def extract_amendment_text(text: str) -> dict[int, str]:
     """
     lines = text.splitlines()
 
-    # Patterns that indicate end of header / start of body
-    body_start_patterns = [
-        r"^The General Assembly",
-        r"^The Security Council",
-        r"^Recalling",
-        r"^Reaffirming",
-        r"^Noting",
-        r"^Recognizing",
-        r"^Welcoming",
-        r"^Expressing",
-        r"^Bearing in mind",
-        r"^Having",
-        r"^Mindful",
-        r"^Concerned",
-        r"^Convinced",
-        r"^Guided by",
-        r"^Taking note",
-        r"^Pursuant to",
-        r"^In operative paragraph",
-        r"^In paragraph",
-        r"^Insert",
-        r"^Replace",
-        r"^Delete",
-        r"^Add",
-        r"^After",
-        r"^Before",
-    ]
-
-    # Patterns that indicate footer / end of body
-    footer_patterns = [
-        r"^\d{2}-\d{5}",  # Document ID like 24-12345
-        r"^\*\d{6,}\*",  # Barcode pattern
-        r"^GE\.\d{2}-\d+",  # Geneva ID
-    ]
-
-    # Header patterns to skip
-    header_patterns = [
-        r"^United Nations$",
-        r"^General Assembly$",
-        r"^Security Council$",
-        r"^[A-Z]{1,2}/[A-Z0-9./-]+$",
-        r"^Agenda item",
-        r"^Item\s+\d+",
-        r"^\d{1,2}\s+\w+\s+\d{4}$",
-        r"^Distr\.",
-        r"^Original:",
-        r"^\w+ session$",
-        r"^(First|Second|Third|Fourth|Fifth|Sixth) Committee$",
-    ]
-
     def is_header_line(line: str) -> bool:
-        return any(re.match(p, line) for p in header_patterns)
+        return _AMENDMENT_HEADER_RE.match(line) is not None
 
     def is_body_start(line: str) -> bool:
-        return any(re.match(p, line, re.IGNORECASE) for p in body_start_patterns)
+        return _AMENDMENT_BODY_START_RE.match(line) is not None
 
     def is_footer_line(line: str) -> bool:
-        return any(re.match(p, line) for p in footer_patterns)
+        return _AMENDMENT_FOOTER_RE.match(line) is not None
 
     # Find body start
     body_start_idx = 0
@@ -418,19 +464,15 @@ def extract_agenda_items(text: str) -> list[str]:
     Returns:
         List of agenda item strings, e.g., ["Item 68", "Item 12A"]
     """
-    items = []
-    patterns = [
-        r"\bAgenda item[s]?\s+(\d+[A-Za-z]?)\b",
-        r"\bItem\s+(\d+[A-Za-z]?)\b",
-    ]
+    # Dicts as ordered sets; explicit "Agenda item" references come first
+    agenda_items = {}
+    other_items = {}
 
-    for pattern in patterns:
-        for match in re.finditer(pattern, text, re.IGNORECASE):
-            item = f"Item {match.group(1)}"
-            if item not in items:
-                items.append(item)
+    for match in _AGENDA_RE.finditer(text):
+        items = agenda_items if match.group("agenda") else other_items
+        items[f"Item {match.group('number')}"] = None
 
-    return items
+    return list({**agenda_items, **other_items})
 
 
 def find_symbol_references(text: str) -> list[str]:
@@ -443,11 +485,9 @@ def find_symbol_references(text: str) -> list[str]:
     Returns:
         List of referenced symbols (unique, in appearance order)
     """
-    pattern = r"\bA(?:/[A-Z0-9.]+)+/L\.\d+\b"
-    matches = re.finditer(pattern, text, re.IGNORECASE)
-    symbols = []
-    for match in matches:
-        symbol = match.group(0).upper()
-        if symbol not in symbols:
-            symbols.append(symbol)
-    return symbols
+    # Every match contains a literal "/L." (either case); most documents have
+    # none, so check for it before running the regex over the whole text.
+    if "/L." not in text and "/l." not in text:
+        return []
+
+    return list(dict.fromkeys(match.group(0).upper() for match in _SYMBOL_RE.finditer(text)))
@@ -55,6 +55,7 @@ from .linking import (
     normalize_title,
     get_linking_audit,
     get_undl_cache_stats,
+    get_undl_timings,
     COMMITTEE_NAMES,
 )
 from .igov import load_igov_decisions, load_igov_decisions_all
@@ -1568,7 +1569,18 @@ def generate_site(config_dir: Path, data_dir: Path, output_dir: Path) -> None:
 
     # Skip UNDL metadata fetching for faster processing if requested
     use_undl_metadata = os.getenv("SKIP_UNDL_METADATA", "false").lower() != "true"
-    link_documents(documents, use_undl_metadata=use_undl_metadata)
+    undl_concurrency = os.getenv("UNDL_CONCURRENCY", "1")
+    undl_concurrency = int(undl_concurrency) if undl_concurrency.isdigit() else 1
+    undl_batch_size = os.getenv("UNDL_BATCH_SIZE", "1")
+    undl_batch_size = int(undl_batch_size) if undl_batch_size.isdigit() else 1
+    link_documents(
+        documents,
+        use_undl_metadata=use_undl_metadata,
+        undl_concurrency=undl_concurrency,
+        undl_batch_size=undl_batch_size,
+    )
+    for stage, timing in get_undl_timings().items():
+        logger.info(f"Linking stage {stage}: {timing['count']} calls in {timing['seconds']:.2f}s")
     annotate_linkage(documents)
     visible_documents = [doc for doc in documents if not doc.get("is_adopted_draft")]
 
@@ -1618,6 +1630,65 @@ def generate_site(config_dir: Path, data_dir: Path, output_dir: Path) -> None:
     print(f"Generated static site with {len(visible_documents)} documents in {output_dir}")
 
 
+def _process_pdf(pdf_file: Path, checks: list) -> tuple:
+    """
+    Process a single PDF file for site generation.
+
+    Module-level so it can run in a worker process.
+
+    Returns:
+        Tuple of (doc, error, identifier, num_paragraphs, signal_summary, duration)
+    """
+    doc_start_time = time.time()
+    symbol = filename_to_symbol(pdf_file.stem)
+
+    try:
+        text = extract_text(pdf_file)
+        paragraphs = extract_operative_paragraphs(text)
+        title = extract_title(text)
+        agenda_items = extract_agenda_items(text)
+        symbol_references = find_symbol_references(text)
+        doc_type = classify_doc_type(symbol, text)
+
+        # For amendments without numbered paragraphs, try alternative extraction
+        if doc_type == "amendment" and not paragraphs:
+            # Try lettered paragraphs first
+            lettered = extract_lettered_paragraphs(text)
+            if lettered:
+                # Convert letter keys to numeric for consistency
+                paragraphs = {i + 1: v for i, (k, v) in enumerate(sorted(lettered.items()))}
+            else:
+                # Fall back to body text extraction
+                paragraphs = extract_amendment_text(text)
+
+        signals = run_checks(paragraphs, checks) if checks else {}
+
+        # Build signal summary
+        signal_summary = {}
+        for para_signals in signals.values():
+            for sig in para_signals:
+                signal_summary[sig] = signal_summary.get(sig, 0) + 1
+
+        doc = {
+            "symbol": symbol,
+            "filename": pdf_file.name,
+            "doc_type": doc_type,
+            "paragraphs": paragraphs,
+            "title": title,
+            "agenda_items": agenda_items,
+            "symbol_references": symbol_references,
+            "signals": signals,
+            "signal_summary": signal_summary,
+            "num_paragraphs": len(paragraphs),
+            "un_url": get_un_document_url(symbol),
+        }
+        doc_duration = time.time() - doc_start_time
+        return (doc, None, symbol, len(paragraphs), signal_summary, doc_duration)
+
+    except Exception as e:
+        return (None, str(e), str(pdf_file), 0, {}, 0)
+
+
 def generate_site_verbose(
     config_dir: Path,
     data_dir: Path,
@@ -1651,7 +1722,7 @@ def generate_site_verbose(
         Dict with stats: total_documents, documents_with_signals, signal_counts, etc.
     """
     import time
-    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from concurrent.futures import ProcessPoolExecutor, as_completed
 
     config_dir = Path(config_dir)
     data_dir = Path(data_dir)
@@ -1669,62 +1740,16 @@ def generate_site_verbose(
     documents = []
     pdfs_dir = data_dir / "pdfs"
 
-    def process_pdf(pdf_file: Path) -> tuple:
-        """Process a single PDF file and return (doc, error) tuple."""
-        doc_start_time = time.time()
-        symbol = filename_to_symbol(pdf_file.stem)
-
-        try:
-            text = extract_text(pdf_file)
-            paragraphs = extract_operative_paragraphs(text)
-            title = extract_title(text)
-            agenda_items = extract_agenda_items(text)
-            symbol_references = find_symbol_references(text)
-            doc_type = classify_doc_type(symbol, text)
-
-            # For amendments without numbered paragraphs, try alternative extraction
-            if doc_type == "amendment" and not paragraphs:
-                # Try lettered paragraphs first
-                lettered = extract_lettered_paragraphs(text)
-                if lettered:
-                    # Convert letter keys to numeric for consistency
-                    paragraphs = {i + 1: v for i, (k, v) in enumerate(sorted(lettered.items()))}
-                else:
-                    # Fall back to body text extraction
-                    paragraphs = extract_amendment_text(text)
-
-            signals = run_checks(paragraphs, checks) if checks else {}
-
-            # Build signal summary
-            signal_summary = {}
-            for para_signals in signals.values():
-                for sig in para_signals:
-                    signal_summary[sig] = signal_summary.get(sig, 0) + 1
-
-            doc = {
-                "symbol": symbol,
-                "filename": pdf_file.name,
-                "doc_type": doc_type,
-                "paragraphs": paragraphs,
-                "title": title,
-                "agenda_items": agenda_items,
-                "symbol_references": symbol_references,
-                "signals": signals,
-                "signal_summary": signal_summary,
-                "num_paragraphs": len(paragraphs),
-                "un_url": get_un_document_url(symbol),
-            }
-            doc_duration = time.time() - doc_start_time
-            return (doc, None, symbol, len(paragraphs), signal_summary, doc_duration)
-
-        except Exception as e:
-            return (None, str(e), str(pdf_file), 0, {}, 0)
-
     if pdfs_dir.exists():
         pdf_files = list(pdfs_dir.glob("*.pdf"))
-        # Use ThreadPoolExecutor for parallel PDF extraction
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            futures = {executor.submit(process_pdf, pdf_file): pdf_file for pdf_file in pdf_files}
+        # Extract in worker processes: pymupdf and the regex parsing hold the
+        # GIL, and pymupdf is not safe to share across threads
+        max_workers = min(8, os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_process_pdf, pdf_file, checks): pdf_file
+                for pdf_file in pdf_files
+            }
             for future in as_completed(futures):
                 doc, error, identifier, num_paras, signal_summary, duration = future.result()
                 if doc:
@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
+import copy
 import hashlib
+import io
 import json
 import logging
 import os
 import re
+import sys
+import threading
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -21,9 +27,37 @@ logger = logging.getLogger(__name__)
 # UN Digital Library API for MARC XML metadata
 UNDL_SEARCH_URL = "https://digitallibrary.un.org/search"
 UNDL_TIMEOUT = 30  # seconds
+# Query parameters shared by every UNDL search (English metadata, MARC XML output)
+_UNDL_BASE_PARAMS = {"ln": "en", "of": "xm"}
 MARC_NS = {"marc": "http://www.loc.gov/MARC21/slim"}
+
 UNDL_CACHE_ENV = "MANDATE_UNDL_CACHE_DIR"
 CACHE_DIR = Path(os.getenv(UNDL_CACHE_ENV, "data/cache/undl"))
+# Maximum age of a cache entry in seconds; unset means entries never expire
+UNDL_CACHE_TTL_ENV = "MANDATE_UNDL_CACHE_TTL"
+
+
+def _parse_cache_ttl(value: str | None) -> float | None:
+    """Parse the cache TTL setting; invalid values are ignored with a warning."""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r; expected seconds", UNDL_CACHE_TTL_ENV, value)
+        return None
+
+
+CACHE_TTL = _parse_cache_ttl(os.getenv(UNDL_CACHE_TTL_ENV))
+
+# MARC XML lookups, in Clark notation so no namespace map is resolved per call
+_MARC = "{%s}" % MARC_NS["marc"]
+_MARC_RECORD_TAG = f"{_MARC}record"
+_MARC_SYMBOL_PATH = f".//{_MARC}datafield[@tag='191']/{_MARC}subfield[@code='a']"
+_MARC_RELATED_PATH = f".//{_MARC}datafield[@tag='993']/{_MARC}subfield[@code='a']"
+
+# Draft proposal (L. document) symbols
+_DRAFT_SYMBOL_RE = re.compile(r"/L\.\d+")
 
 # Committee names for display
 COMMITTEE_NAMES = {
@@ -40,9 +74,52 @@ COMMITTEE_NAMES = {
 # Global linking audit storage
 _linking_audit: dict[str, dict[str, Any]] = {}
 
+# In-process memo of UNDL metadata by symbol, in front of the disk cache
+UNDL_MEMO_SIZE = 4096
+_undl_metadata_memo: dict[str, dict] = {}
+_undl_metadata_memo_lock = threading.Lock()
+
+# Cumulative wall-clock time per linking stage: name -> {"count", "seconds"}
+_undl_timings: dict[str, dict[str, float]] = {}
+_undl_timings_lock = threading.Lock()
+
 _SESSION = None
 
 
+@contextmanager
+def _span(name: str) -> Iterator[None]:
+    """Time a linking stage, adding to its totals in _undl_timings."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        # Lookups may run in worker threads
+        with _undl_timings_lock:
+            entry = _undl_timings.setdefault(name, {"count": 0, "seconds": 0.0})
+            entry["count"] += 1
+            entry["seconds"] += elapsed
+        logger.debug("%s took %.1f ms", name, elapsed * 1000)
+
+
+def get_undl_timings() -> dict[str, dict[str, float]]:
+    """
+    Return cumulative timings of UNDL lookups and linking passes.
+
+    Keys are stage names ("undl.request", "undl.parse", "link.pass0_undl",
+    "link.pass1_symbol_refs"); values hold the number of timed calls and
+    their total duration in seconds.
+    """
+    with _undl_timings_lock:
+        return {name: dict(entry) for name, entry in _undl_timings.items()}
+
+
+def clear_undl_timings() -> None:
+    """Clear the accumulated UNDL and linking timings."""
+    with _undl_timings_lock:
+        _undl_timings.clear()
+
+
 def _get_session() -> requests.Session:
     """Get or create a reusable requests session with retries."""
     global _SESSION
@@ -65,8 +142,10 @@ def fetch_undl_metadata(symbol: str) -> dict | None:
     Queries the UNDL search API for the given symbol and parses the MARC XML
     response to extract related document symbols from tag 993.
 
-    Includes caching and rate limiting. Cache location can be overridden via
-    the MANDATE_UNDL_CACHE_DIR environment variable.
+    Includes caching and rate limiting. Results are memoized in-process (see
+    clear_undl_metadata_memo) in front of the disk cache, whose location can
+    be overridden via the MANDATE_UNDL_CACHE_DIR environment variable. Set
+    MANDATE_UNDL_CACHE_TTL (seconds) to re-fetch entries older than that.
 
     Args:
         symbol: UN resolution symbol (e.g., "A/RES/80/142")
@@ -80,17 +159,12 @@ def fetch_undl_metadata(symbol: str) -> dict | None:
             "base_proposal": str | None,   # first L. document
         }
     """
-    # 1. Check cache
-    cached = _get_cached_metadata(symbol)
-    if cached:
-        return cached
+    # 0-1. Check in-process memo, then disk cache
+    local = _get_local_metadata(symbol)
+    if local is not None:
+        return local
 
-    params = {
-        "ln": "en",
-        "of": "xm",  # MARC XML output format
-        "p": symbol,
-        "rg": "5",  # limit results
-    }
+    params = {**_UNDL_BASE_PARAMS, "p": symbol, "rg": "5"}  # limit results
 
     # 2. Use reused session
     session = _get_session()
@@ -101,7 +175,8 @@ def fetch_undl_metadata(symbol: str) -> dict | None:
 
     for attempt in range(max_retries):
         try:
-            resp = session.get(UNDL_SEARCH_URL, params=params, timeout=UNDL_TIMEOUT)
+            with _span("undl.request"):
+                resp = session.get(UNDL_SEARCH_URL, params=params, timeout=UNDL_TIMEOUT)
 
             # Handle rate limiting specifically
             if resp.status_code == 429:
@@ -117,13 +192,16 @@ def fetch_undl_metadata(symbol: str) -> dict | None:
 
             resp.raise_for_status()
 
-            result, parsed_ok = _parse_undl_marc_xml_with_status(resp.text, symbol)
+            with _span("undl.parse"):
+                result, parsed_ok = _parse_undl_marc_xml_with_status(resp.text, symbol)
 
             if result:
                 _save_cached_metadata(symbol, result)
+                _remember_metadata(symbol, result)
             elif parsed_ok:
                 result = _build_empty_metadata(symbol)
                 _save_cached_metadata(symbol, result)
+                _remember_metadata(symbol, result)
 
             # 4. Be polite with longer delay (increased from 1s to 3s)
             time.sleep(3)
@@ -142,6 +220,141 @@ def fetch_undl_metadata(symbol: str) -> dict | None:
                 return None
 
 
+def fetch_undl_metadata_batch(symbols: list[str]) -> dict[str, dict]:
+    """
+    Fetch resolution metadata for several symbols with one UNDL search.
+
+    Symbols not already memoized or cached are OR-joined into a single tag 191
+    query, and every MARC record in the response is matched back to its
+    symbol. Symbols missing from the batch response (or all of them, if the
+    batch request fails) are looked up one at a time via fetch_undl_metadata.
+
+    Args:
+        symbols: UN resolution symbols (e.g., ["A/RES/80/142", "A/RES/80/143"])
+
+    Returns:
+        Mapping of symbol to metadata (see fetch_undl_metadata); symbols whose
+        lookup failed are omitted
+    """
+    results = {}
+    pending = []
+    for symbol in symbols:
+        local = _get_local_metadata(symbol)
+        if local is not None:
+            results[symbol] = local
+        elif symbol not in pending:
+            pending.append(symbol)
+
+    if len(pending) > 1:
+        for symbol, metadata in _search_undl_batch(pending).items():
+            _save_cached_metadata(symbol, metadata)
+            _remember_metadata(symbol, metadata)
+            results[symbol] = metadata
+
+    # Fall back to single-symbol lookups for anything the batch missed
+    for symbol in pending:
+        if symbol not in results:
+            metadata = fetch_undl_metadata(symbol)
+            if metadata is not None:
+                results[symbol] = metadata
+
+    return results
+
+
+def _search_undl_batch(symbols: list[str]) -> dict[str, dict]:
+    """Run one UNDL search for several symbols; returns {} if the request fails."""
+    params = {
+        **_UNDL_BASE_PARAMS,
+        "p": " OR ".join(f'191:"{symbol}"' for symbol in symbols),
+        "rg": str(5 * len(symbols)),  # same per-symbol limit as single lookups
+    }
+
+    try:
+        with _span("undl.request"):
+            resp = _get_session().get(UNDL_SEARCH_URL, params=params, timeout=UNDL_TIMEOUT)
+        resp.raise_for_status()
+        with _span("undl.parse"):
+            found = _extract_undl_metadata_many(_iter_marc_records(resp.text), symbols)
+    except (requests.RequestException, ET.ParseError) as e:
+        # Single-symbol lookups retry with backoff, so just hand over to them
+        logger.warning("Batch UNDL lookup of %d symbols failed: %s", len(symbols), e)
+        return {}
+
+    # Be polite, as for single lookups
+    time.sleep(3)
+
+    return found
+
+
+def _get_local_metadata(symbol: str) -> dict | None:
+    """Return metadata from the in-process memo or the disk cache, if present."""
+    with _undl_metadata_memo_lock:
+        memoized = _undl_metadata_memo.get(symbol)
+    if memoized is not None:
+        return copy.deepcopy(memoized)
+
+    cached = _get_cached_metadata(symbol)
+    if cached:
+        _remember_metadata(symbol, cached)
+        return cached
+
+    return None
+
+
+def _remember_metadata(symbol: str, data: dict) -> None:
+    """Memoize metadata for a symbol; failures are never memoized so they are retried."""
+    data = copy.deepcopy(data)
+    with _undl_metadata_memo_lock:
+        if len(_undl_metadata_memo) >= UNDL_MEMO_SIZE:
+            # Evict the oldest entry
+            del _undl_metadata_memo[next(iter(_undl_metadata_memo))]
+        _undl_metadata_memo[symbol] = data
+
+
+def clear_undl_metadata_memo() -> None:
+    """Clear the in-process UNDL metadata memo."""
+    with _undl_metadata_memo_lock:
+        _undl_metadata_memo.clear()
+
+
+def _fetch_undl_metadata_many(
+    symbols: list[str], concurrency: int = 1, batch_size: int = 1
+) -> list[dict | None]:
+    """
+    Fetch UNDL metadata for several symbols, optionally in parallel.
+
+    Each worker keeps fetch_undl_metadata's politeness delay, so UNDL sees at
+    most `concurrency` requests every few seconds.
+
+    Args:
+        symbols: Resolution symbols to look up
+        concurrency: Number of simultaneous lookups (1 = sequential)
+        batch_size: Number of symbols per UNDL search (1 = one request each)
+
+    Returns:
+        Metadata (or None) for each symbol, in input order
+    """
+    if batch_size > 1:
+        batches = [symbols[i:i + batch_size] for i in range(0, len(symbols), batch_size)]
+        found = {}
+        for batch_results in _map_undl_lookups(fetch_undl_metadata_batch, batches, concurrency):
+            found.update(batch_results)
+        return [found.get(symbol) for symbol in symbols]
+
+    return _map_undl_lookups(fetch_undl_metadata, symbols, concurrency)
+
+
+def _map_undl_lookups(lookup, items: list, concurrency: int) -> list:
+    """Apply a UNDL lookup to each item, in parallel when concurrency > 1."""
+    if concurrency <= 1 or len(items) <= 1:
+        return [lookup(item) for item in items]
+
+    # Create the shared session up front rather than racing in the workers
+    _get_session()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        return list(executor.map(lookup, items))
+
+
 def _get_cache_path(symbol: str) -> Path:
     """Generate a safe cache file path for a symbol."""
     # Use MD5 hash to handle special characters and length
@@ -165,6 +378,8 @@ def _get_cached_metadata(symbol: str) -> dict | None:
     cache_path = _get_cache_path(symbol)
     if cache_path.exists():
         try:
+            if CACHE_TTL is not None and time.time() - cache_path.stat().st_mtime > CACHE_TTL:
+                return None
             with open(cache_path, "r", encoding="utf-8") as f:
                 return json.load(f)
         except (json.JSONDecodeError, OSError) as e:
@@ -186,42 +401,77 @@ def _save_cached_metadata(symbol: str, data: dict) -> None:
         logger.warning("Failed to save cache for %s: %s", symbol, e)
 
 
-def _extract_undl_metadata(root: ET.Element, target_symbol: str) -> dict | None:
-    """Extract metadata for a target symbol from a parsed MARC XML root."""
+def _iter_marc_records(xml_text: str) -> Iterator[ET.Element]:
+    """
+    Yield MARC records from an XML response as each one finishes parsing.
+
+    Records are cleared once the consumer moves past them, so memory stays
+    bounded by one record. Raises ET.ParseError when malformed XML is reached.
+    """
+    for _, element in ET.iterparse(io.StringIO(xml_text), events=("end",)):
+        if element.tag == _MARC_RECORD_TAG:
+            yield element
+            element.clear()
+
+
+def _extract_undl_metadata(records: Iterable[ET.Element], target_symbol: str) -> dict | None:
+    """Extract metadata for a target symbol from MARC XML records."""
     # Normalize target for comparison
     target_upper = target_symbol.upper()
 
-    for record in root.findall(".//marc:record", MARC_NS):
-        # Check tag 191 subfield 'a' for the document symbol
-        tag_191 = record.find(
-            ".//marc:datafield[@tag='191']/marc:subfield[@code='a']", MARC_NS
-        )
-        if tag_191 is None or not tag_191.text:
-            continue
+    for record in records:
+        if _record_symbol(record) == target_upper:
+            return _build_record_metadata(record, target_symbol)
+
+    return None
+
+
+def _extract_undl_metadata_many(
+    records: Iterable[ET.Element], target_symbols: list[str]
+) -> dict[str, dict]:
+    """Extract metadata for each target symbol found in MARC XML records."""
+    targets = {symbol.upper(): symbol for symbol in target_symbols}
+    found = {}
 
-        record_symbol = tag_191.text.strip().upper()
-        if record_symbol != target_upper:
+    for record in records:
+        target_symbol = targets.pop(_record_symbol(record), None)
+        if target_symbol is None:
             continue
 
-        # Found matching record - extract tag 993 cross-references
-        related_symbols = []
-        for tag_993 in record.findall(
-            ".//marc:datafield[@tag='993']/marc:subfield[@code='a']", MARC_NS
-        ):
-            if tag_993.text:
-                related_symbols.append(tag_993.text.strip())
-
-        # Filter for L. documents (draft proposals)
-        draft_symbols = [s for s in related_symbols if re.search(r"/L\.\d+", s)]
-
-        return {
-            "symbol": target_symbol,
-            "related_symbols": related_symbols,
-            "draft_symbols": draft_symbols,
-            "base_proposal": draft_symbols[0] if draft_symbols else None,
-        }
+        found[target_symbol] = _build_record_metadata(record, target_symbol)
+        if not targets:
+            break
 
-    return None
+    return found
+
+
+def _record_symbol(record: ET.Element) -> str | None:
+    """Return a MARC record's document symbol (tag 191), upper-cased."""
+    tag_191 = record.find(_MARC_SYMBOL_PATH)
+    if tag_191 is None or not tag_191.text:
+        return None
+    return tag_191.text.strip().upper()
+
+
+def _build_record_metadata(record: ET.Element, symbol: str) -> dict:
+    """Build the metadata payload for a matching MARC record."""
+    # Extract tag 993 cross-references. The same drafts and meeting records
+    # recur across resolutions, so intern them to share one copy each.
+    related_symbols = [
+        sys.intern(tag_993.text.strip())
+        for tag_993 in record.iterfind(_MARC_RELATED_PATH)
+        if tag_993.text
+    ]
+
+    # Filter for L. documents (draft proposals)
+    draft_symbols = [s for s in related_symbols if _DRAFT_SYMBOL_RE.search(s)]
+
+    return {
+        "symbol": symbol,
+        "related_symbols": related_symbols,
+        "draft_symbols": draft_symbols,
+        "base_proposal": draft_symbols[0] if draft_symbols else None,
+    }
 
 
 def _parse_undl_marc_xml_with_status(
@@ -233,14 +483,14 @@ def _parse_undl_marc_xml_with_status(
     Returns:
         Tuple of (parsed metadata dict or None, whether XML parsed successfully)
     """
+    # Parse incrementally and stop at the matching record; anything after it
+    # is never parsed.
     try:
-        root = ET.fromstring(xml_text)
+        return _extract_undl_metadata(_iter_marc_records(xml_text), target_symbol), True
     except ET.ParseError as e:
         logger.warning("Failed to parse UNDL XML for %s: %s", target_symbol, e)
         return None, False
 
-    return _extract_undl_metadata(root, target_symbol), True
-
 
 def _parse_undl_marc_xml(xml_text: str, target_symbol: str) -> dict | None:
     """
@@ -273,7 +523,7 @@ def classify_symbol(symbol: str) -> str:
     upper_symbol = symbol.upper()
     if "/RES/" in upper_symbol:
         return "resolution"
-    if re.search(r"/L\.\d+", upper_symbol):
+    if _DRAFT_SYMBOL_RE.search(upper_symbol):
         return "proposal"
     return "other"
 
@@ -409,7 +659,12 @@ def get_undl_cache_stats() -> dict[str, Any]:
     }
 
 
-def link_documents(documents: list[dict], use_undl_metadata: bool = True) -> None:
+def link_documents(
+    documents: list[dict],
+    use_undl_metadata: bool = True,
+    undl_concurrency: int = 1,
+    undl_batch_size: int = 1,
+) -> None:
     """
     Link resolutions to proposals using explicit references and fuzzy matching.
 
@@ -421,51 +676,64 @@ def link_documents(documents: list[dict], use_undl_metadata: bool = True) -> Non
         documents: List of document dictionaries with at least 'symbol' key.
         use_undl_metadata: If True, query UN Digital Library for authoritative
             base proposal symbols before falling back to PDF text extraction.
+        undl_concurrency: Number of UN Digital Library lookups to run in
+            parallel (1 = sequential).
+        undl_batch_size: Number of resolutions to look up per UN Digital
+            Library search (1 = one request per resolution).
     """
     global _linking_audit
     clear_linking_audit()
 
     proposals_by_symbol = {doc["symbol"]: doc for doc in documents if is_proposal(doc["symbol"])}
-    proposals = list(proposals_by_symbol.values())
+    # Partition once so the passes below only walk resolutions
+    resolutions = [doc for doc in documents if is_resolution(doc["symbol"])]
 
     for doc in documents:
         doc.setdefault("linked_resolution_symbol", None)
         doc.setdefault("linked_proposal_symbols", [])
 
+    if not resolutions:
+        return
+
     # Initialize audit entries for all resolutions
-    for doc in documents:
-        if is_resolution(doc["symbol"]):
-            _linking_audit[doc["symbol"]] = {
-                "symbol": doc["symbol"],
-                "title": doc.get("title", ""),
-                "pass0_undl": {"attempted": False, "found": False, "refs": [], "linked": []},
-                "pass1_symbol_refs": {"attempted": False, "refs_in_text": [], "linked": []},
-                "pass2_fuzzy": {
-                    "attempted": False,
-                    "resolution_title": normalize_title(doc.get("title", "")),
-                    "candidates": [],
-                    "best_match": None,
-                    "best_score": 0.0,
-                    "agenda_overlap": False,
-                },
-                "final_method": None,
-                "final_linked": [],
-                "confidence": 0,
-            }
-
-    # Pass 0: UN Digital Library metadata lookup (authoritative source)
-    if use_undl_metadata:
-        for doc in documents:
-            if not is_resolution(doc["symbol"]):
-                continue
-            # Skip if already linked
-            if doc.get("linked_proposal_symbols"):
-                continue
+    for doc in resolutions:
+        _linking_audit[doc["symbol"]] = {
+            "symbol": doc["symbol"],
+            "title": doc.get("title", ""),
+            "pass0_undl": {"attempted": False, "found": False, "refs": [], "linked": []},
+            "pass1_symbol_refs": {"attempted": False, "refs_in_text": [], "linked": []},
+            "pass2_fuzzy": {
+                "attempted": False,
+                "resolution_title": normalize_title(doc.get("title", "")),
+                "candidates": [],
+                "best_match": None,
+                "best_score": 0.0,
+                "agenda_overlap": False,
+            },
+            "final_method": None,
+            "final_linked": [],
+            "confidence": 0,
+        }
 
+    # Pass 0: UN Digital Library metadata lookup (authoritative source).
+    # UNDL links only to proposals we have locally, so skip it without any.
+    if use_undl_metadata and proposals_by_symbol:
+        # Skip resolutions that are already linked, or whose text references
+        # a local proposal that Pass 1 will link without a network request
+        to_fetch = [
+            doc for doc in resolutions
+            if not doc.get("linked_proposal_symbols")
+            and not any(ref in proposals_by_symbol for ref in doc.get("symbol_references", []))
+        ]
+        with _span("link.pass0_undl"):
+            all_metadata = _fetch_undl_metadata_many(
+                [doc["symbol"] for doc in to_fetch], undl_concurrency, undl_batch_size
+            )
+
+        for doc, metadata in zip(to_fetch, all_metadata):
             audit = _linking_audit[doc["symbol"]]
             audit["pass0_undl"]["attempted"] = True
 
-            metadata = fetch_undl_metadata(doc["symbol"])
             if metadata is None or not metadata.get("draft_symbols"):
                 continue
 
@@ -490,37 +758,35 @@ def link_documents(documents: list[dict], use_undl_metadata: bool = True) -> Non
                         proposal["linked_resolution_symbol"] = doc["symbol"]
 
     # Pass 1: Symbol references from PDF text
-    for doc in documents:
-        if not is_resolution(doc["symbol"]):
-            continue
-
-        audit = _linking_audit[doc["symbol"]]
-        references = doc.get("symbol_references", [])
-        proposal_refs = [ref for ref in references if is_proposal(ref)]
-        audit["pass1_symbol_refs"]["refs_in_text"] = proposal_refs
+    with _span("link.pass1_symbol_refs"):
+        for doc in resolutions:
+            audit = _linking_audit[doc["symbol"]]
+            references = doc.get("symbol_references", [])
+            proposal_refs = [ref for ref in references if is_proposal(ref)]
+            audit["pass1_symbol_refs"]["refs_in_text"] = proposal_refs
 
-        # Skip if already linked via UNDL metadata
-        if doc.get("linked_proposal_symbols"):
-            continue
+            # Skip if already linked via UNDL metadata
+            if doc.get("linked_proposal_symbols"):
+                continue
 
-        audit["pass1_symbol_refs"]["attempted"] = True
-        linked = [ref for ref in proposal_refs if ref in proposals_by_symbol]
-        audit["pass1_symbol_refs"]["linked"] = linked
+            audit["pass1_symbol_refs"]["attempted"] = True
+            linked = [ref for ref in proposal_refs if ref in proposals_by_symbol]
+            audit["pass1_symbol_refs"]["linked"] = linked
 
-        if not linked:
-            continue
+            if not linked:
+                continue
 
-        doc["linked_proposal_symbols"] = linked
-        audit["final_method"] = "symbol_ref"
-        audit["final_linked"] = linked
-        audit["confidence"] = 100
+            doc["linked_proposal_symbols"] = linked
+            audit["final_method"] = "symbol_ref"
+            audit["final_linked"] = linked
+            audit["confidence"] = 100
 
-        for ref in linked:
-            proposal = proposals_by_symbol.get(ref)
-            if proposal is None:
-                continue
-            if proposal.get("linked_resolution_symbol") is None:
-                proposal["linked_resolution_symbol"] = doc["symbol"]
+            for ref in linked:
+                proposal = proposals_by_symbol.get(ref)
+                if proposal is None:
+                    continue
+                if proposal.get("linked_resolution_symbol") is None:
+                    proposal["linked_resolution_symbol"] = doc["symbol"]
 
 
 
@@ -20,15 +20,16 @@ class TestDownloadDocumentUnit:
 
     def test_download_saves_file(self, tmp_path, mocker):
         """Given a valid symbol, download and save the PDF file."""
-        # Mock the HTTP response
-        mock_response = mocker.Mock()
+        # Mock the streamed HTTP response
+        mock_response = mocker.MagicMock()
+        mock_response.__enter__.return_value = mock_response
         mock_response.status_code = 200
-        mock_response.content = b"%PDF-1.4 fake pdf content"
+        mock_response.iter_content.return_value = [b"%PDF-1.4 fake ", b"pdf content"]
         mock_response.headers = {"Content-Type": "application/pdf"}
-        mock_response.raise_for_status = mocker.Mock()
 
-        mock_get = mocker.patch("mandate_pipeline.downloader.requests.get")
-        mock_get.return_value = mock_response
+        mock_session = mocker.Mock()
+        mock_session.get.return_value = mock_response
+        mocker.patch("mandate_pipeline.downloader._get_session", return_value=mock_session)
 
         # Download the document
         result = download_document("A/RES/77/1", output_dir=tmp_path)
@@ -38,6 +39,65 @@ class TestDownloadDocumentUnit:
         assert expected_file.exists()
         assert expected_file.read_bytes() == b"%PDF-1.4 fake pdf content"
         assert result == expected_file
+        assert mock_session.get.call_args.kwargs["stream"] is True
+
+    def test_download_interrupted_leaves_no_file(self, tmp_path, mocker):
+        """An interrupted stream does not leave a partial PDF behind."""
+        import requests
+
+        def broken_stream(chunk_size):
+            yield b"%PDF-1.4 partial"
+            raise requests.ConnectionError("connection reset")
+
+        mock_response = mocker.MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.iter_content.side_effect = broken_stream
+
+        mock_session = mocker.Mock()
+        mock_session.get.return_value = mock_response
+        mocker.patch("mandate_pipeline.downloader._get_session", return_value=mock_session)
+
+        with pytest.raises(requests.ConnectionError):
+            download_document("A/RES/77/1", output_dir=tmp_path)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_fetch_saves_existing_document(self, tmp_path, mocker):
+        """fetch_document checks and downloads with a single GET."""
+        from mandate_pipeline.downloader import fetch_document
+
+        mock_response = mocker.MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "application/pdf"}
+        mock_response.iter_content.return_value = [b"%PDF-1.4 fake pdf"]
+
+        mock_session = mocker.Mock()
+        mock_session.get.return_value = mock_response
+        mocker.patch("mandate_pipeline.downloader._get_session", return_value=mock_session)
+
+        result = fetch_document("A/80/L.1", output_dir=tmp_path)
+
+        assert result == tmp_path / "A_80_L.1.pdf"
+        assert result.read_bytes() == b"%PDF-1.4 fake pdf"
+        assert mock_session.get.call_count == 1
+        mock_session.head.assert_not_called()
+
+    def test_fetch_missing_document_returns_none(self, tmp_path, mocker):
+        """fetch_document returns None and writes nothing for an error page."""
+        from mandate_pipeline.downloader import fetch_document
+
+        mock_response = mocker.MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.status_code = 200
+        mock_response.headers = {"Content-Type": "text/html; charset=utf-8"}
+
+        mock_session = mocker.Mock()
+        mock_session.get.return_value = mock_response
+        mocker.patch("mandate_pipeline.downloader._get_session", return_value=mock_session)
+
+        assert fetch_document("A/80/L.999", output_dir=tmp_path) is None
+        assert list(tmp_path.iterdir()) == []
 
 
 @pytest.mark.integration
@@ -320,6 +380,43 @@ class TestDiscoverDocuments:
 
         assert found == ["A/80/L.1", "A/80/L.4"]
 
+    def test_discover_concurrent_preserves_order(self, mocker):
+        """Concurrent checks yield the same hits and stop point as sequential ones."""
+        pattern = {
+            "name": "test",
+            "template": "A/{session}/L.{number}",
+            "session": 80,
+            "start": 1,
+        }
+
+        existing = {"A/80/L.1", "A/80/L.2", "A/80/L.4"}
+        mock_exists = mocker.patch("mandate_pipeline.discovery.document_exists")
+        mock_exists.side_effect = lambda symbol: symbol in existing
+
+        found = list(discover_documents(pattern, max_consecutive_misses=3, concurrency=4))
+
+        assert found == ["A/80/L.1", "A/80/L.2", "A/80/L.4"]
+        # 7 checks needed to reach 3 misses, plus at most 3 speculative ones
+        assert 7 <= mock_exists.call_count <= 10
+
+    def test_discover_concurrent_shrinks_window_on_misses(self, mocker):
+        """Misses shrink the probe window so few checks run past the end."""
+        pattern = {
+            "name": "test",
+            "template": "A/{session}/L.{number}",
+            "session": 80,
+            "start": 1,
+        }
+
+        mock_exists = mocker.patch("mandate_pipeline.discovery.document_exists")
+        mock_exists.side_effect = lambda symbol: symbol == "A/80/L.1"
+
+        found = list(discover_documents(pattern, max_consecutive_misses=10, concurrency=16))
+
+        assert found == ["A/80/L.1"]
+        # 11 checks needed; a fixed window of 16 would issue 26
+        assert 11 <= mock_exists.call_count < 20
+
     def test_discover_real_documents(self, tmp_path):
         """Integration test: discover real L documents."""
         pattern = {
@@ -369,6 +466,20 @@ class TestSyncState:
         assert loaded["last_sync"] == "2026-01-20T06:00:00Z"
         assert loaded["patterns"]["L documents"]["highest_found"] == 42
 
+    def test_load_state_cached_copy_isolated(self, tmp_path):
+        """Repeated loads return independent copies that track rewrites."""
+        from mandate_pipeline.discovery import load_sync_state, save_sync_state
+
+        state_file = tmp_path / "state.json"
+        save_sync_state(state_file, {"patterns": {"L documents": {"highest_found": 1}}})
+
+        first = load_sync_state(state_file)
+        first["patterns"]["L documents"]["highest_found"] = 99
+        assert load_sync_state(state_file)["patterns"]["L documents"]["highest_found"] == 1
+
+        save_sync_state(state_file, {"patterns": {"L documents": {"highest_found": 2}}})
+        assert load_sync_state(state_file)["patterns"]["L documents"]["highest_found"] == 2
+
     def test_get_start_number_no_state(self, tmp_path):
         """Get start number returns pattern start if no state."""
         from mandate_pipeline.discovery import get_start_number
@@ -403,13 +514,10 @@ class TestSyncDocuments:
         }
         state = {"patterns": {"L documents": {"highest_found": 2}}}
 
-        # Mock: docs 3, 4 exist, then 5, 6, 7 don't
+        # Mock: docs 3, 4 exist (and are downloaded), then 5, 6, 7 don't
+        mock_fetch = mocker.patch("mandate_pipeline.discovery.fetch_document")
+        mock_fetch.side_effect = [tmp_path / "3.pdf", tmp_path / "4.pdf", None, None, None]
         mock_exists = mocker.patch("mandate_pipeline.discovery.document_exists")
-        mock_exists.side_effect = [True, True, False, False, False]
-
-        # Mock download
-        mock_download = mocker.patch("mandate_pipeline.discovery.download_document")
-        mock_download.return_value = tmp_path / "fake.pdf"
 
         data_dir = tmp_path / "data"
         data_dir.mkdir()
@@ -420,7 +528,9 @@ class TestSyncDocuments:
 
         assert new_docs == ["A/80/L.3", "A/80/L.4"]
         assert new_highest == 4
-        assert mock_download.call_count == 2
+        assert mock_fetch.call_count == 5
+        # Existence is known from the download request; no separate HEAD
+        mock_exists.assert_not_called()
 
     def test_sync_no_new_documents(self, tmp_path, mocker):
         """Sync returns empty list when no new documents."""
@@ -435,10 +545,8 @@ class TestSyncDocuments:
         state = {"patterns": {"L documents": {"highest_found": 42}}}
 
         # Mock: 43, 44, 45 all don't exist
-        mock_exists = mocker.patch("mandate_pipeline.discovery.document_exists")
-        mock_exists.side_effect = [False, False, False]
-
-        mock_download = mocker.patch("mandate_pipeline.discovery.download_document")
+        mock_fetch = mocker.patch("mandate_pipeline.discovery.fetch_document")
+        mock_fetch.side_effect = [None, None, None]
 
         data_dir = tmp_path / "data"
         data_dir.mkdir()
@@ -449,7 +557,44 @@ class TestSyncDocuments:
 
         assert new_docs == []
         assert new_highest == 42  # unchanged
-        assert mock_download.call_count == 0
+        assert mock_fetch.call_count == 3
+        assert list((data_dir / "pdfs").iterdir()) == []
+
+    def test_sync_concurrent_matches_sequential(self, tmp_path, mocker):
+        """Concurrent sync keeps no downloads past the stop point."""
+        from mandate_pipeline.discovery import sync_simple_pattern
+
+        pattern = {
+            "name": "L documents",
+            "template": "A/{session}/L.{number}",
+            "session": 80,
+            "start": 1,
+        }
+        existing = {f"A/80/L.{n}" for n in (3, 4, 5, 6, 7, 8, 12)}
+
+        def fake_fetch(symbol, output_dir):
+            if symbol not in existing:
+                return None
+            path = output_dir / (symbol.replace("/", "_") + ".pdf")
+            path.write_bytes(b"%PDF-1.4 fake")
+            return path
+
+        mocker.patch("mandate_pipeline.discovery.fetch_document", side_effect=fake_fetch)
+
+        results = {}
+        for concurrency in (1, 8):
+            output_dir = tmp_path / f"pdfs-{concurrency}"
+            output_dir.mkdir()
+            new_docs, highest = sync_simple_pattern(
+                pattern, {"patterns": {}}, tmp_path, output_dir,
+                max_consecutive_misses=3, concurrency=concurrency,
+            )
+            files = sorted(path.name for path in output_dir.iterdir())
+            results[concurrency] = (new_docs, highest, files)
+
+        assert results[1][0] == [f"A/80/L.{n}" for n in range(3, 9)]
+        assert results[1][1] == 8
+        assert results[8] == results[1]
 
 
 class TestStaticGenerator:
@@ -190,6 +190,22 @@ progress made in this regard.
         assert 100 in result
         assert 101 in result
 
+    def test_extract_number_on_own_line(self):
+        """Handle paragraph numbers separated from their text by a line break."""
+        text = """
+1.
+Calls upon all Member States
+to provide assistance;
+2.
+Decides to remain seized of the matter.
+"""
+        result = extract_operative_paragraphs(text)
+
+        assert result == {
+            1: "Calls upon all Member States to provide assistance;",
+            2: "Decides to remain seized of the matter.",
+        }
+
 
 class TestExtractTitle:
     """Test document title extraction."""
@@ -768,3 +784,23 @@ class TestDataQualityRealDocuments:
         assert results["has_text"] == results["total"], "All docs should have text"
         assert results["has_title"] >= results["total"] * 0.9, "90%+ should have title"
         assert results["has_agenda"] >= results["total"] * 0.8, "80%+ should have agenda"
+
+
+class TestModuleDefinitions:
+    """Test the extractor module's source layout."""
+
+    def test_no_duplicate_top_level_definitions(self):
+        """Each function and class is defined only once in extractor.py."""
+        import ast
+
+        import mandate_pipeline.extractor as extractor
+
+        tree = ast.parse(Path(extractor.__file__).read_text(encoding="utf-8"))
+        names = [
+            node.name
+            for node in tree.body
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
+        ]
+
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        assert duplicates == []
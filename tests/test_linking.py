@@ -4,6 +4,7 @@
 from pathlib import Path
 
 import pytest
+import requests
 
 from mandate_pipeline.linking import (
     symbol_to_filename,
@@ -17,7 +18,12 @@ from mandate_pipeline.linking import (
     is_base_proposal_doc,
     link_documents,
     annotate_linkage,
+    get_linking_audit,
     fetch_undl_metadata,
+    fetch_undl_metadata_batch,
+    clear_undl_metadata_memo,
+    clear_undl_timings,
+    get_undl_timings,
     _parse_undl_marc_xml,
 )
 
@@ -78,39 +84,51 @@ SAMPLE_MARC_XML_MULTIPLE_DRAFTS = """<?xml version="1.0" encoding="UTF-8"?>
 </collection>
 """
 
+# Search response carrying the records of two resolutions
+SAMPLE_MARC_XML_BATCH = SAMPLE_MARC_XML.replace(
+    "</collection>",
+    SAMPLE_MARC_XML_MULTIPLE_DRAFTS.split("<collection xmlns=\"http://www.loc.gov/MARC21/slim\">")[1],
+)
+
 
 class TestParseUndlMarcXml:
     """Tests for MARC XML parsing."""
 
-    def test_parse_resolution_with_draft(self):
-        """Parse resolution metadata with draft symbol in tag 993."""
-        result = _parse_undl_marc_xml(SAMPLE_MARC_XML, "A/RES/80/142")
-
-        assert result is not None
-        assert result["symbol"] == "A/RES/80/142"
-        assert "A/C.2/80/L.35/Rev.1" in result["related_symbols"]
-        assert "A/80/PV.64" in result["related_symbols"]
-        assert result["draft_symbols"] == ["A/C.2/80/L.35/Rev.1"]
-        assert result["base_proposal"] == "A/C.2/80/L.35/Rev.1"
-
-    def test_parse_resolution_no_draft(self):
-        """Parse resolution without draft symbol."""
-        result = _parse_undl_marc_xml(SAMPLE_MARC_XML_NO_DRAFT, "A/RES/80/166")
-
-        assert result is not None
-        assert result["symbol"] == "A/RES/80/166"
-        assert result["draft_symbols"] == []
-        assert result["base_proposal"] is None
-
-    def test_parse_resolution_multiple_drafts(self):
-        """Parse resolution with multiple draft symbols."""
-        result = _parse_undl_marc_xml(SAMPLE_MARC_XML_MULTIPLE_DRAFTS, "A/RES/80/100")
+    @pytest.mark.parametrize(
+        "xml_text,target,expected_drafts,expected_related",
+        [
+            pytest.param(
+                SAMPLE_MARC_XML,
+                "A/RES/80/142",
+                ["A/C.2/80/L.35/Rev.1"],
+                ["A/C.2/80/L.35/Rev.1", "A/80/PV.64", "A/80/555"],
+                id="with_draft",
+            ),
+            pytest.param(
+                SAMPLE_MARC_XML_NO_DRAFT,
+                "A/RES/80/166",
+                [],
+                ["A/80/PV.70"],
+                id="no_draft",
+            ),
+            pytest.param(
+                SAMPLE_MARC_XML_MULTIPLE_DRAFTS,
+                "A/RES/80/100",
+                ["A/80/L.50", "A/80/L.51"],
+                ["A/80/L.50", "A/80/L.51"],
+                id="multiple_drafts",
+            ),
+        ],
+    )
+    def test_parse_resolution(self, xml_text, target, expected_drafts, expected_related):
+        """Parse resolution metadata and draft symbols from tag 993."""
+        result = _parse_undl_marc_xml(xml_text, target)
 
         assert result is not None
-        assert len(result["draft_symbols"]) == 2
-        assert "A/80/L.50" in result["draft_symbols"]
-        assert "A/80/L.51" in result["draft_symbols"]
-        assert result["base_proposal"] == "A/80/L.50"
+        assert result["symbol"] == target
+        assert result["related_symbols"] == expected_related
+        assert result["draft_symbols"] == expected_drafts
+        assert result["base_proposal"] == (expected_drafts[0] if expected_drafts else None)
 
     def test_parse_symbol_not_found(self):
         """Return None when target symbol not in XML."""
@@ -141,6 +159,24 @@ class TestParseUndlMarcXml:
         assert result is not None
         assert result["symbol"] == "a/res/80/142"
 
+    def test_parse_stops_at_matching_record(self):
+        """Stop parsing once the target record is found."""
+        # Trailing malformed content is never reached
+        truncated_xml = SAMPLE_MARC_XML.replace("</collection>", "<record><datafield")
+
+        result = _parse_undl_marc_xml(truncated_xml, "A/RES/80/142")
+
+        assert result is not None
+        assert result["draft_symbols"] == ["A/C.2/80/L.35/Rev.1"]
+
+
+@pytest.fixture(autouse=True)
+def clear_undl_memo():
+    """Keep memoized UNDL metadata from leaking between tests."""
+    clear_undl_metadata_memo()
+    yield
+    clear_undl_metadata_memo()
+
 
 @pytest.fixture
 def mock_session(mocker):
@@ -171,9 +207,8 @@ class TestFetchUndlMetadata:
 
     def test_fetch_network_error(self, mocker, mock_session):
         """Return None on network error."""
-        import requests
-
         mock_session.get.side_effect = requests.RequestException("Connection failed")
+        mocker.patch("mandate_pipeline.linking.time.sleep")
         mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
 
         result = fetch_undl_metadata("A/RES/80/142")
@@ -182,12 +217,11 @@ class TestFetchUndlMetadata:
 
     def test_fetch_http_error(self, mocker, mock_session):
         """Return None on HTTP error status."""
-        import requests
-
         mock_response = mocker.Mock()
         mock_response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
 
         mock_session.get.return_value = mock_response
+        mocker.patch("mandate_pipeline.linking.time.sleep")
         mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
 
         result = fetch_undl_metadata("A/RES/80/142")
@@ -196,15 +230,69 @@ class TestFetchUndlMetadata:
 
     def test_fetch_timeout(self, mocker, mock_session):
         """Return None on timeout."""
-        import requests
-
         mock_session.get.side_effect = requests.Timeout("Request timed out")
+        mocker.patch("mandate_pipeline.linking.time.sleep")
         mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
 
         result = fetch_undl_metadata("A/RES/80/142")
 
         assert result is None
 
+    def test_fetch_memoizes_repeat_lookups(self, mocker, mock_session):
+        """Repeat lookups of a symbol are served from memory."""
+        mock_response = mocker.Mock()
+        mock_response.status_code = 200
+        mock_response.text = SAMPLE_MARC_XML
+        mock_response.raise_for_status = mocker.Mock()
+
+        mock_session.get.return_value = mock_response
+        mocker.patch("mandate_pipeline.linking.time.sleep")
+        mocker.patch("mandate_pipeline.linking._save_cached_metadata")
+        mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
+
+        first = fetch_undl_metadata("A/RES/80/142")
+        first["draft_symbols"].append("A/80/L.999")  # callers get their own copy
+        second = fetch_undl_metadata("A/RES/80/142")
+
+        assert mock_session.get.call_count == 1
+        assert second["draft_symbols"] == ["A/C.2/80/L.35/Rev.1"]
+
+    def test_fetch_failure_not_memoized(self, mocker, mock_session):
+        """A failed lookup is retried on the next call."""
+        mock_response = mocker.Mock()
+        mock_response.status_code = 200
+        mock_response.text = SAMPLE_MARC_XML
+        mock_response.raise_for_status = mocker.Mock()
+
+        mock_session.get.side_effect = [requests.RequestException("Connection failed")] * 5 + [mock_response]
+        mocker.patch("mandate_pipeline.linking.time.sleep")
+        mocker.patch("mandate_pipeline.linking._save_cached_metadata")
+        mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
+
+        assert fetch_undl_metadata("A/RES/80/142") is None
+        assert fetch_undl_metadata("A/RES/80/142") is not None
+
+    def test_fetch_records_timings(self, mocker, mock_session):
+        """Time the UNDL request and parse of each network lookup."""
+        mock_response = mocker.Mock()
+        mock_response.status_code = 200
+        mock_response.text = SAMPLE_MARC_XML
+        mock_response.raise_for_status = mocker.Mock()
+
+        mock_session.get.return_value = mock_response
+        mocker.patch("mandate_pipeline.linking.time.sleep")
+        mocker.patch("mandate_pipeline.linking._save_cached_metadata")
+        mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
+        clear_undl_timings()
+
+        fetch_undl_metadata("A/RES/80/142")
+        fetch_undl_metadata("A/RES/80/142")  # memoized, not timed again
+
+        timings = get_undl_timings()
+        assert timings["undl.request"]["count"] == 1
+        assert timings["undl.parse"]["count"] == 1
+        assert timings["undl.parse"]["seconds"] >= 0
+
     def test_fetch_symbol_not_found_cached(self, mocker, mock_session):
         """Cache empty metadata when the symbol is missing from a valid response."""
         mock_response = mocker.Mock()
@@ -225,6 +313,47 @@ class TestFetchUndlMetadata:
         assert result["not_found"] is True
         save_cache.assert_called_once()
 
+    def test_fetch_batch_single_request(self, mocker, mock_session):
+        """Fetch several symbols with one UNDL search."""
+        mock_response = mocker.Mock()
+        mock_response.status_code = 200
+        mock_response.text = SAMPLE_MARC_XML_BATCH
+        mock_response.raise_for_status = mocker.Mock()
+
+        mock_session.get.return_value = mock_response
+        mocker.patch("mandate_pipeline.linking.time.sleep")
+        mocker.patch("mandate_pipeline.linking._save_cached_metadata")
+        mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
+
+        results = fetch_undl_metadata_batch(["A/RES/80/142", "A/RES/80/100"])
+
+        assert mock_session.get.call_count == 1
+        query = mock_session.get.call_args.kwargs["params"]["p"]
+        assert query == '191:"A/RES/80/142" OR 191:"A/RES/80/100"'
+        assert results["A/RES/80/142"]["base_proposal"] == "A/C.2/80/L.35/Rev.1"
+        assert results["A/RES/80/100"]["draft_symbols"] == ["A/80/L.50", "A/80/L.51"]
+
+    def test_fetch_batch_falls_back_for_missing_symbols(self, mocker, mock_session):
+        """Look up symbols missing from the batch response individually."""
+        def get(url, params, timeout):
+            mock_response = mocker.Mock()
+            mock_response.status_code = 200
+            # The batch search only returns the first resolution
+            mock_response.text = SAMPLE_MARC_XML if " OR " in params["p"] else SAMPLE_MARC_XML_NO_DRAFT
+            return mock_response
+
+        mock_session.get.side_effect = get
+        mocker.patch("mandate_pipeline.linking.time.sleep")
+        mocker.patch("mandate_pipeline.linking._save_cached_metadata")
+        mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
+
+        results = fetch_undl_metadata_batch(["A/RES/80/142", "A/RES/80/166"])
+
+        assert mock_session.get.call_count == 2
+        assert mock_session.get.call_args.kwargs["params"]["p"] == "A/RES/80/166"
+        assert results["A/RES/80/142"]["draft_symbols"] == ["A/C.2/80/L.35/Rev.1"]
+        assert results["A/RES/80/166"]["draft_symbols"] == []
+
 
 class TestLinkDocumentsWithUndl:
     """Tests for link_documents with UNDL metadata integration."""
@@ -254,7 +383,7 @@ class TestLinkDocumentsWithUndl:
         assert proposal["linked_resolution_symbol"] == "A/RES/80/142"
 
     def test_link_fallback_to_symbol_reference(self, mocker, mock_session):
-        """Fall back to symbol reference when UNDL has no draft."""
+        """Link via a local symbol reference without querying UNDL."""
         mock_response = mocker.Mock()
         mock_response.status_code = 200
         mock_response.text = SAMPLE_MARC_XML_NO_DRAFT
@@ -277,8 +406,92 @@ class TestLinkDocumentsWithUndl:
 
         resolution = documents[0]
 
-        # Should fall back to Pass 1 (symbol_reference)
+        # The reference resolves locally, so Pass 1 links it and UNDL is skipped
+        mock_session.get.assert_not_called()
         assert "A/80/L.99" in resolution["linked_proposal_symbols"]
+        assert get_linking_audit()["A/RES/80/166"]["final_method"] == "symbol_ref"
+
+    def test_link_queries_undl_for_unresolved_reference(self, mocker, mock_session):
+        """Query UNDL when the resolution's references are not in the collection."""
+        mock_response = mocker.Mock()
+        mock_response.status_code = 200
+        mock_response.text = SAMPLE_MARC_XML
+        mock_response.raise_for_status = mocker.Mock()
+
+        mock_session.get.return_value = mock_response
+        mocker.patch("mandate_pipeline.linking.time.sleep")
+        mocker.patch("mandate_pipeline.linking._save_cached_metadata")
+        mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
+
+        documents = [
+            {
+                "symbol": "A/RES/80/142",
+                "title": "Test Resolution",
+                "symbol_references": ["A/C.2/80/L.35"],  # not collected locally
+            },
+            {"symbol": "A/C.2/80/L.35/Rev.1", "title": "Test Draft"},
+        ]
+
+        link_documents(documents, use_undl_metadata=True)
+
+        mock_session.get.assert_called_once()
+        assert documents[0]["linked_proposal_symbols"] == ["A/C.2/80/L.35/Rev.1"]
+
+    def test_link_via_undl_metadata_concurrent(self, mocker, mock_session):
+        """Parallel UNDL lookups link the same proposals as sequential ones."""
+        responses = {
+            "A/RES/80/142": SAMPLE_MARC_XML,
+            "A/RES/80/100": SAMPLE_MARC_XML_MULTIPLE_DRAFTS,
+        }
+
+        def get(url, params, timeout):
+            mock_response = mocker.Mock()
+            mock_response.status_code = 200
+            mock_response.text = responses[params["p"]]
+            return mock_response
+
+        mock_session.get.side_effect = get
+        mocker.patch("mandate_pipeline.linking.time.sleep")
+        mocker.patch("mandate_pipeline.linking._save_cached_metadata")
+        mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
+
+        documents = [
+            {"symbol": "A/RES/80/142", "title": "Test Resolution"},
+            {"symbol": "A/RES/80/100", "title": "Other Resolution"},
+            {"symbol": "A/C.2/80/L.35/Rev.1", "title": "Test Draft"},
+            {"symbol": "A/80/L.50", "title": "Other Draft"},
+        ]
+
+        link_documents(documents, use_undl_metadata=True, undl_concurrency=4)
+
+        assert documents[0]["linked_proposal_symbols"] == ["A/C.2/80/L.35/Rev.1"]
+        assert documents[1]["linked_proposal_symbols"] == ["A/80/L.50"]
+        assert documents[3]["linked_resolution_symbol"] == "A/RES/80/100"
+
+    def test_link_via_undl_metadata_batched(self, mocker, mock_session):
+        """Batched UNDL lookups link resolutions with a single request."""
+        mock_response = mocker.Mock()
+        mock_response.status_code = 200
+        mock_response.text = SAMPLE_MARC_XML_BATCH
+        mock_response.raise_for_status = mocker.Mock()
+
+        mock_session.get.return_value = mock_response
+        mocker.patch("mandate_pipeline.linking.time.sleep")
+        mocker.patch("mandate_pipeline.linking._save_cached_metadata")
+        mocker.patch("mandate_pipeline.linking._get_cached_metadata", return_value=None)
+
+        documents = [
+            {"symbol": "A/RES/80/142", "title": "Test Resolution"},
+            {"symbol": "A/RES/80/100", "title": "Other Resolution"},
+            {"symbol": "A/C.2/80/L.35/Rev.1", "title": "Test Draft"},
+            {"symbol": "A/80/L.50", "title": "Other Draft"},
+        ]
+
+        link_documents(documents, use_undl_metadata=True, undl_batch_size=50)
+
+        assert mock_session.get.call_count == 1
+        assert documents[0]["linked_proposal_symbols"] == ["A/C.2/80/L.35/Rev.1"]
+        assert documents[1]["linked_proposal_symbols"] == ["A/80/L.50"]
 
     def test_link_undl_disabled(self, mocker):
         """Skip UNDL lookup when disabled."""
@@ -319,6 +532,32 @@ class TestLinkDocumentsWithUndl:
         # Should not call API for already-linked resolution
         mock_get_session.assert_not_called()
 
+    def test_link_proposals_only_skips_undl(self, mocker):
+        """Skip UNDL lookup when there are no resolutions to link."""
+        mock_get_session = mocker.patch("mandate_pipeline.linking._get_session")
+
+        documents = [
+            {"symbol": "A/80/L.1", "title": "Test Draft"},
+            {"symbol": "A/C.3/80/L.2", "title": "Other Draft"},
+        ]
+
+        link_documents(documents, use_undl_metadata=True)
+
+        mock_get_session.assert_not_called()
+        assert documents[0]["linked_resolution_symbol"] is None
+        assert documents[1]["linked_proposal_symbols"] == []
+
+    def test_link_resolutions_only_skips_undl(self, mocker):
+        """Skip UNDL lookup when there are no local proposals to link to."""
+        mock_get_session = mocker.patch("mandate_pipeline.linking._get_session")
+
+        documents = [{"symbol": "A/RES/80/142", "title": "Test Resolution"}]
+
+        link_documents(documents, use_undl_metadata=True)
+
+        mock_get_session.assert_not_called()
+        assert documents[0]["linked_proposal_symbols"] == []
+
 
 # =============================================================================
 # UNIT TESTS: Helper Functions
@@ -12,6 +12,13 @@ from urllib3.exceptions import MaxRetryError
 # Import the module to test
 from mandate_pipeline import linking
 
+@pytest.fixture(autouse=True)
+def clear_undl_memo():
+    """Keep memoized UNDL metadata from leaking between tests."""
+    linking.clear_undl_metadata_memo()
+    yield
+    linking.clear_undl_metadata_memo()
+
 @pytest.fixture
 def mock_cache_dir(tmp_path, monkeypatch):
     """Mock the cache directory to use a temporary path."""
@@ -80,6 +87,31 @@ class TestRateLimitingAndRetries:
         # Verify network was NOT called
         mock_requests_session.get.assert_not_called()
 
+    def test_expired_cache_entry_ignored(self, mock_cache_dir, monkeypatch):
+        """Test that cache entries older than the TTL are treated as misses."""
+        import hashlib
+        import os
+
+        symbol = "A/RES/80/3"
+        file_hash = hashlib.md5(symbol.encode()).hexdigest()
+        cache_file = mock_cache_dir / f"{file_hash}.json"
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"symbol": symbol}))
+
+        monkeypatch.setattr("mandate_pipeline.linking.CACHE_TTL", 60)
+        assert linking._get_cached_metadata(symbol) == {"symbol": symbol}
+
+        two_minutes_ago = time.time() - 120
+        os.utime(cache_file, (two_minutes_ago, two_minutes_ago))
+        assert linking._get_cached_metadata(symbol) is None
+
+    def test_invalid_cache_ttl_ignored(self):
+        """Test that an unparseable TTL setting disables expiry instead of failing."""
+        assert linking._parse_cache_ttl("3600") == 3600.0
+        assert linking._parse_cache_ttl("1d") is None
+        assert linking._parse_cache_ttl("") is None
+        assert linking._parse_cache_ttl(None) is None
+
     def test_save_to_cache(self, mocker, mock_cache_dir, mock_requests_session):
         """Test that successful network responses are saved to cache."""
         symbol = "A/RES/80/2"